@@ -29,9 +29,14 @@ class Snapshot:
             headings_by_level=snap['headings_by_level']
         )
 
-def compare(pre: Snapshot, post: Snapshot, safety: Any, logger: logging.Logger) -> list[str]:
-    """Compare pre/post snapshots and return warnings"""
+def compare(
+    pre: Snapshot | None, post: Snapshot | None, safety: Any, logger: logging.Logger
+) -> list[str]:
+    """Compare pre/post snapshots and return warnings (none if either snapshot was skipped)"""
     warnings = []
+
+    if pre is None or post is None:
+        return warnings
     
     if safety.require_same_paragraph_count and pre.paragraph_count != post.paragraph_count:
         warnings.append(
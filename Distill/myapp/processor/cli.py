@@ -23,6 +23,7 @@ def main() -> None:
     parser.add_argument("--audit", action="store_true", help="Write audit JSON per file.")
     parser.add_argument("--dry-run", action="store_true", help="No DOCX/PDF saved; only audit if --audit is set.")
     parser.add_argument("--verbose", action="store_true", help="Verbose logging.")
+    parser.add_argument("--workers", type=int, default=1, help="Parallel worker processes for batch runs (default: 1).")
 
     args = parser.parse_args()
 
@@ -45,6 +46,7 @@ def main() -> None:
             write_audit=bool(args.audit),
             dry_run=bool(args.dry_run),
             verbose=bool(args.verbose),
+            workers=max(1, args.workers),
         )
     else:
         code = run(
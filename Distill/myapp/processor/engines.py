@@ -12,6 +12,8 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, Protocol
 
+from .recipes_word._utils import invalidate_page_range_cache, iter_collection, iter_paragraphs
+
 logger = logging.getLogger(__name__)
 
 
@@ -194,36 +196,57 @@ class WordComEngine(Engine):
     wdParagraph = 4
     wdExtend = 1
 
-    def __init__(self) -> None:
-        """Initialize Word application via COM."""
+    # Wipe and rebuild gen_py on start-up. Batch worker processes turn this
+    # off: they share one gen_py folder and must not delete it under each other.
+    reset_gencache = True
+
+    @classmethod
+    def prepare_gencache(cls) -> None:
+        """
+        Generate the Word type library wrappers in gen_py without starting Word.
+
+        Wipes and rebuilds gen_py first when reset_gencache is set. Batch runs
+        call this once in the parent process so workers only read the result.
+        """
         try:
-            import win32com.client
             import win32com.client.gencache
-            import pythoncom
-            import sys
             import shutil
             import os
-            from pathlib import Path
         except ImportError as e:
             raise RuntimeError(
                 "pywin32 not available. Install with: pip install pywin32"
             ) from e
 
-        # Force generation of static typelib
-        logger.info("Initializing Word COM engine with forced type library generation")
-        try:
+        if cls.reset_gencache:
             # Reset the gen_py directory
             gen_py = Path(win32com.client.gencache.GetGeneratePath())
             if gen_py.exists():
                 shutil.rmtree(str(gen_py))
             os.makedirs(str(gen_py))
-            
+
             # Reset the cache
             win32com.client.gencache.Rebuild()
-            
-            # Known Word type library info
-            # Microsoft Word 16.0 Object Library (Office 2016+)
-            win32com.client.gencache.EnsureModule('{00020905-0000-0000-C000-000000000046}', 0, 8, 7)
+
+        # Known Word type library info
+        # Microsoft Word 16.0 Object Library (Office 2016+)
+        win32com.client.gencache.EnsureModule('{00020905-0000-0000-C000-000000000046}', 0, 8, 7)
+
+    def __init__(self) -> None:
+        """Initialize Word application via COM."""
+        try:
+            import win32com.client
+            import win32com.client.gencache
+            import pythoncom
+            import sys
+        except ImportError as e:
+            raise RuntimeError(
+                "pywin32 not available. Install with: pip install pywin32"
+            ) from e
+
+        # Force generation of static typelib
+        logger.info("Initializing Word COM engine with forced type library generation")
+        try:
+            self.prepare_gencache()
             
             # Initialize Word with makepy support
             logger.info("Creating Word application instance")
@@ -250,6 +273,7 @@ class WordComEngine(Engine):
 
     def close_document(self, doc: Any) -> None:
         """Close document without saving."""
+        invalidate_page_range_cache(doc)
         try:
             doc.Close(SaveChanges=False)
         except Exception as e:
@@ -277,7 +301,7 @@ class WordComEngine(Engine):
     def select_by_style(self, doc: Any, styles: list[str]) -> list[Any]:
         """Select paragraphs by style."""
         ranges = []
-        for para in doc.Paragraphs:
+        for para in iter_paragraphs(doc):
             if para.Style.NameLocal in styles:
                 ranges.append(para.Range)
         logger.debug(f"Selected {len(ranges)} paragraphs by style: {styles}")
@@ -351,7 +375,7 @@ class WordComEngine(Engine):
 
         if section:
             if section == "all":
-                for sec in doc.Sections:
+                for sec in iter_collection(doc.Sections):
                     ranges.append(sec.Range)
             else:
                 sec_idx = int(section)
@@ -426,7 +450,7 @@ class WordComEngine(Engine):
 
     def set_headers_footers(self, doc: Any, config: dict[str, Any]) -> None:
         """Set section headers and footers."""
-        for section in doc.Sections:
+        for section in iter_collection(doc.Sections):
             if "header" in config:
                 hdr_cfg = config["header"]
                 # wdHeaderFooterPrimary = 1
@@ -510,7 +534,7 @@ class WordComEngine(Engine):
 
     def apply_page_setup(self, doc: Any, setup: dict[str, Any]) -> None:
         """Apply page setup to all sections."""
-        for section in doc.Sections:
+        for section in iter_collection(doc.Sections):
             ps = section.PageSetup
 
             if "margins" in setup:
@@ -632,7 +656,7 @@ class WordComEngine(Engine):
         }
 
         # Count headings by level
-        for para in doc.Paragraphs:
+        for para in iter_paragraphs(doc):
             style = para.Style.NameLocal
             if "Heading" in style:
                 snap["headings_by_level"][style] = snap["headings_by_level"].get(style, 0) + 1
@@ -16,7 +16,7 @@ def enforce_list_left_indents_level1to3_py(doc: Any) -> dict:
     errors = []
 
     wdListNoNumbering = 0
-    wdTrailingNone = 0
+    wdTrailingNone = 2
     wdUndefined = -9999999
 
     inches_to_points = word.InchesToPoints
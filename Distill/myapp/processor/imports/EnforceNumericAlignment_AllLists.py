@@ -9,8 +9,8 @@ def enforce_numeric_alignment_all_lists():
 
     wdListNoNumbering = 0
     wdListLevelAlignRight = 2
-    wdTrailingNone = 0
-    wdTrailingTab = 1
+    wdTrailingNone = 2
+    wdTrailingTab = 0
     wdUndefined = -9999999
 
     inches_to_points = word.InchesToPoints
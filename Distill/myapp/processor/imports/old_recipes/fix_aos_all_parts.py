@@ -1,28 +1,72 @@
 from __future__ import annotations
+import re
 from typing import Any
-from win32com.client import constants as C
+from ...recipes_word.engines import C
 from ...recipes_word._utils import (
     PT_PER_CM,
+    FastWord,
+    find_anchor_page,
+    iter_paragraphs,
     looks_like_manual_number,
+    page_window,
+    to_twips,
     replace_in_para,
     remove_all_spaces_after_dash,
 )
 
+AOS_HEADING = "ARRANGEMENT OF SECTIONS"
+
+# Manual-number rewrites, in order: (Python pre-check, Word wildcard, replacement).
+# Word wildcards have no zero-occurrence repeat, so the four shapes cannot
+# be merged into one Find; the pre-check skips the ones with nothing to do.
+_MANUAL_NUMBER_REWRITES = (
+    (re.compile(r"[0-9]+[A-Z]{1,3}[.)][ \t]", re.I), "([0-9]{1,}[A-Z]{1,3})[.)][ ^t]@", "\\1—"),
+    (re.compile(r"[0-9]+[A-Z]{1,3}[ \t]", re.I), "([0-9]{1,}[A-Z]{1,3})[ ^t]@", "\\1—"),
+    (re.compile(r"[0-9]+[.)][ \t]"), "([0-9]{1,})[.)][ ^t]@", "\\1—"),
+    (re.compile(r"[0-9]+[ \t]"), "([0-9]{1,})[ ^t]@", "\\1—"),
+)
+_DASH_SPACE_RE = re.compile(r"—[ \t]")
+
+
+def _apply_block_format(pf: Any, side: float, side_tw: int) -> bool:
+    """
+    Give the AOS range the centred-block layout; True if anything changed.
+
+    Works on the whole range at once: a property that differs between its
+    paragraphs reads back as wdUndefined and is rewritten. Setters trigger
+    a relayout, so only what is not already in place is written.
+    """
+    wrote = False
+    if to_twips(pf.LeftIndent) != side_tw:
+        pf.LeftIndent = side
+        wrote = True
+    if to_twips(pf.RightIndent) != side_tw:
+        pf.RightIndent = side
+        wrote = True
+    if pf.FirstLineIndent != 0:
+        pf.FirstLineIndent = 0
+        wrote = True
+    if pf.Alignment != C.wdAlignParagraphLeft:
+        pf.Alignment = C.wdAlignParagraphLeft
+        wrote = True
+    if pf.SpaceBefore != 0:
+        pf.SpaceBefore = 0
+        wrote = True
+    if pf.SpaceAfter != 0:
+        pf.SpaceAfter = 0
+        wrote = True
+    # A range only reports the tab stops its paragraphs share, so the count
+    # cannot tell whether any are left; clearing none is a no-op anyway
+    pf.TabStops.ClearAll()
+    return wrote
+
 
 def fix_aos_all_parts_py(doc: Any, block_width_cm: float = 12.0, pages_span: int = 3) -> dict:
     """Centers AoS section and normalizes numbering (Word-based version)."""
-    r = doc.Content.Duplicate
-    f = r.Find
-    f.ClearFormatting()
-    f.Replacement.ClearFormatting()
-    f.Text = "ARRANGEMENT OF SECTIONS"
-    f.MatchWildcards = False
-    f.MatchCase = False
-    f.Wrap = C.wdFindStop
-    if not f.Execute():
+    aos_first_pg = find_anchor_page(doc, AOS_HEADING)
+    if aos_first_pg is None:
         return {"ok": False, "reason": "AOS heading not found"}
 
-    aos_first_pg = r.Information(C.wdActiveEndPageNumber)
     aos_last_pg = aos_first_pg + int(pages_span)
 
     page_w = doc.PageSetup.PageWidth
@@ -31,55 +75,65 @@ def fix_aos_all_parts_py(doc: Any, block_width_cm: float = 12.0, pages_span: int
     text_w = page_w - lm - rm
     block_w = min(max(block_width_cm * PT_PER_CM, 1.0), text_w * 0.9)
     side = (text_w - block_w) / 2.0
+    side_tw = to_twips(side)
 
-    first_item = None
-    for p in doc.Paragraphs:
-        pg = p.Range.Information(C.wdActiveEndPageNumber)
-        if aos_first_pg <= pg <= aos_last_pg:
-            if p.Range.ListFormat.ListType != C.wdListNoNumbering or looks_like_manual_number(p):
-                first_item = p
-                break
-    if first_item is None:
-        return {"ok": False, "reason": "No list items on AOS pages"}
-
-    if first_item.Range.ListFormat.ListType != C.wdListNoNumbering:
-        lvl = first_item.Range.ListFormat.ListTemplate.ListLevels(1)
-        lvl.NumberStyle = C.wdListNumberStyleArabic
-        lvl.NumberFormat = "%1—"
-        lvl.TrailingCharacter = C.wdTrailingNone
-        lvl.Alignment = C.wdListLevelAlignLeft
-        lvl.NumberPosition = 0
-        lvl.TextPosition = 0
-        lvl.TabPosition = C.wdUndefined
-
-    touched = 0
-    for p in doc.Paragraphs:
-        pg = p.Range.Information(C.wdActiveEndPageNumber)
-        if not (aos_first_pg <= pg <= aos_last_pg):
-            continue
-
-        if p.Range.ListFormat.ListType != C.wdListNoNumbering:
-            try:
-                if p.Range.ListFormat.ListLevelNumber != 1:
-                    p.Range.ListFormat.ListLevelNumber = 1
-            except Exception:
-                pass
-        elif looks_like_manual_number(p):
-            replace_in_para(p, "([0-9]{1,}[A-Z]{1,3})[.)][ ^t]@", "\\1—")
-            replace_in_para(p, "([0-9]{1,}[A-Z]{1,3})[ ^t]@", "\\1—")
-            replace_in_para(p, "([0-9]{1,})[.)][ ^t]@", "\\1—")
-            replace_in_para(p, "([0-9]{1,})[ ^t]@", "\\1—")
-            remove_all_spaces_after_dash(p)
-
-        pf = p.Range.ParagraphFormat
-        pf.LeftIndent = side
-        pf.RightIndent = side
-        pf.FirstLineIndent = 0
-        pf.Alignment = C.wdAlignParagraphLeft
-        p.Range.ParagraphFormat.TabStops.ClearAll()
-        pf.SpaceBefore = 0
-        pf.SpaceAfter = 0
-        touched += 1
+    # Looked up once; each C.<name> is an attribute access
+    wd_list_no_numbering = C.wdListNoNumbering
+
+    # Resolve the AOS pages to one character range up front instead of asking
+    # every paragraph in the document for its page number
+    aos_window = page_window(doc, aos_first_pg, aos_last_pg)
+    aos_rng = doc.Content if aos_window is doc else aos_window
+
+    with FastWord(doc, normal_view=True):
+        touched = 0
+        first_found = False
+        # Only list numbering varies per paragraph; the layout is applied
+        # to the whole AOS range afterwards
+        for p in list(iter_paragraphs(aos_window)):
+            lf = p.Range.ListFormat
+            is_list = lf.ListType != wd_list_no_numbering
+            is_manual = not is_list and looks_like_manual_number(p)
+            if not (is_list or is_manual):
+                continue
+
+            if not first_found:
+                first_found = True
+                if is_list:
+                    lvl = lf.ListTemplate.ListLevels(1)
+                    lvl.NumberStyle = C.wdListNumberStyleArabic
+                    lvl.NumberFormat = "%1—"
+                    lvl.TrailingCharacter = C.wdTrailingNone
+                    lvl.Alignment = C.wdListLevelAlignLeft
+                    lvl.NumberPosition = 0
+                    lvl.TextPosition = 0
+                    lvl.TabPosition = C.wdUndefined
+
+            if is_list:
+                try:
+                    if lf.ListLevelNumber != 1:
+                        lf.ListLevelNumber = 1
+                        touched += 1
+                except Exception:
+                    pass
+            else:
+                # Rewrites only remove text after a number, so a shape absent
+                # from the original text cannot appear later in the sequence
+                text = p.Range.Text or ""
+                rewrote = False
+                for check, find_pat, repl in _MANUAL_NUMBER_REWRITES:
+                    if check.search(text):
+                        replace_in_para(p, find_pat, repl)
+                        rewrote = True
+                if rewrote or _DASH_SPACE_RE.search(text):
+                    remove_all_spaces_after_dash(p)
+                touched += 1
+
+        if not first_found:
+            return {"ok": False, "reason": "No list items on AOS pages"}
+
+        if _apply_block_format(aos_rng.ParagraphFormat, side, side_tw):
+            touched += aos_rng.Paragraphs.Count
 
     return {
         "ok": True,
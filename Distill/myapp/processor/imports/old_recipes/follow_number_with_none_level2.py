@@ -1,7 +1,8 @@
 # formatter/recipes/word_follow_number_none.py
 from __future__ import annotations
 from typing import Any
-from win32com.client import constants as C
+from ...recipes_word.engines import C
+from ...recipes_word._utils import get_page_range, position_of
 
 
 def follow_number_with_none_level2_py(
@@ -28,25 +29,22 @@ def follow_number_with_none_level2_py(
     try:
         # --- Define Range for page span ---
         try:
-            start_rng = doc.GoTo(What=C.wdGoToPage, Which=C.wdGoToAbsolute, Count=page_start)
-            end_rng = doc.GoTo(What=C.wdGoToPage, Which=C.wdGoToAbsolute, Count=page_end + 1)
-            rng = doc.Range(start_rng.Start, end_rng.Start)
+            rng = doc.Range(*get_page_range(doc, page_start, page_end))
         except Exception as e:
             return {"ok": False, "reason": f"Failed to set page range: {str(e)}"}
 
-        # --- Loop through all paragraphs in this range ---
-        for p in rng.Paragraphs:
+        # --- Loop through list paragraphs only; plain text never reaches COM ---
+        # (the collection's own enumerator; Item(i) counts from the start each time)
+        for p in rng.ListParagraphs:
             try:
-                lf = p.Range.ListFormat
-                # Check if paragraph has any list formatting
-                if lf.ListType == C.wdListNoNumbering:
-                    continue
-                    
+                p_rng = p.Range
+                lf = p_rng.ListFormat
                 # Check if it's level 2
                 if lf.ListLevelNumber != 2:
                     continue
 
-                lvl = lf.ListTemplate.ListLevels(2)
+                list_template = lf.ListTemplate
+                lvl = list_template.ListLevels(2)
                 
                 # Store original values for verification
                 old_trailing = lvl.TrailingCharacter
@@ -58,8 +56,8 @@ def follow_number_with_none_level2_py(
                 lvl.TextPosition = lvl.NumberPosition
 
                 # Reapply level 2 so change reflects immediately
-                p.Range.ListFormat.ApplyListTemplateWithLevel(
-                    ListTemplate=lf.ListTemplate,
+                lf.ApplyListTemplateWithLevel(
+                    ListTemplate=list_template,
                     ContinuePreviousList=True,
                     ApplyLevel=2,
                 )
@@ -69,7 +67,7 @@ def follow_number_with_none_level2_py(
                     lvl.TabPosition == 0):
                     count += 1
                 else:
-                    errors.append(f"Failed to apply changes to paragraph at position {p.Range.Start}")
+                    errors.append(f"Failed to apply changes to paragraph at position {position_of(p_rng)}")
                     
             except Exception as e:
                 errors.append(f"Error processing paragraph: {str(e)}")
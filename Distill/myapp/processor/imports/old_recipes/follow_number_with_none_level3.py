@@ -1,7 +1,22 @@
 # formatter/recipes_word/word_follow_number_none3.py
 from __future__ import annotations
 from typing import Any
-from win32com.client import constants as C
+from ...recipes_word.engines import C
+from ...recipes_word._utils import (
+    FastWord,
+    compile_exclude_patterns,
+    get_page_range,
+    iter_paragraphs,
+)
+
+DEFAULT_EXCLUDE_PATTERNS = ("AOS", "Appendix", "Schedule")
+# The defaults are plain words, so a lower-cased substring test on the start of
+# the paragraph is enough; only custom patterns need the regex engine
+_DEFAULT_EXCLUDE_LITERALS = tuple(k.lower() for k in DEFAULT_EXCLUDE_PATTERNS)
+_EXCLUDE_HEAD_CHARS = 40
+
+# wdAlignParagraphLeft / Center / Right
+_ALIGN_MAP = {"left": 0, "center": 1, "right": 2}
 
 
 def follow_number_with_none_level3_py(
@@ -15,28 +30,29 @@ def follow_number_with_none_level3_py(
     Accepts any extra params gracefully (for YAML flexibility).
     Only affects *true* level 3 numbered lists within given page range.
     """
-
-    import re
-    from win32com.client import constants as C
-
     if page_end < page_start:
         return {"ok": False, "reason": "End page must be >= start page"}
 
-    app = doc.Application
-    app.ScreenUpdating = False
     count = 0
 
-    try:
-        start_rng = doc.GoTo(What=C.wdGoToPage, Which=C.wdGoToAbsolute, Count=page_start)
-        end_rng = doc.GoTo(What=C.wdGoToPage, Which=C.wdGoToAbsolute, Count=page_end + 1)
-        rng = doc.Range(start_rng.Start, end_rng.Start)
+    # Page offsets come from the layout, so resolve them before bulk mode
+    rng = doc.Range(*get_page_range(doc, page_start, page_end))
 
-        exclude_patterns = [
-            re.compile(pat, re.I)
-            for pat in params.get("exclude_patterns", ["AOS", "Appendix", "Schedule"])
-        ]
+    with FastWord(doc, normal_view=True):
+        custom_excludes = params.get("exclude_patterns")
+        exclude_patterns = (
+            compile_exclude_patterns(tuple(custom_excludes))
+            if custom_excludes is not None else None
+        )
 
-        for p in rng.Paragraphs:
+        # Paragraph format targets are the same for every paragraph
+        space_before = params.get("spacing_before_pt", 0)
+        space_after = params.get("spacing_after_pt", 0)
+        line_spacing = params.get("line_spacing_multiple", 1.0) * 12
+        keep_with_next = params.get("keep_with_next", False)
+        alignment = _ALIGN_MAP.get(params.get("paragraph_alignment", "left").lower(), 0)
+
+        for p in iter_paragraphs(rng):
             try:
                 lf = p.Range.ListFormat
 
@@ -54,31 +70,45 @@ def follow_number_with_none_level3_py(
                     continue
 
                 # --- Exclude AOS, Appendix, etc. ---
-                text = p.Range.Text.strip()
-                if any(pat.search(text) for pat in exclude_patterns):
-                    continue
+                if exclude_patterns is None:
+                    # Only marshal the head of the paragraph, not all of it
+                    head = p.Range.Duplicate
+                    head.End = min(head.End, head.Start + _EXCLUDE_HEAD_CHARS)
+                    head_text = head.Text.lower()
+                    if any(k in head_text for k in _DEFAULT_EXCLUDE_LITERALS):
+                        continue
+                else:
+                    text = p.Range.Text.strip()
+                    if any(pat.search(text) for pat in exclude_patterns):
+                        continue
 
                 # --- Apply spacing tweaks if requested ---
                 fmt = p.Format
-                fmt.SpaceBefore = params.get("spacing_before_pt", 0)
-                fmt.SpaceAfter = params.get("spacing_after_pt", 0)
+                fmt.SpaceBefore = space_before
+                fmt.SpaceAfter = space_after
                 fmt.LineSpacingRule = 4  # wdLineSpaceMultiple
-                fmt.LineSpacing = params.get("line_spacing_multiple", 1.0) * 12
-                fmt.KeepWithNext = params.get("keep_with_next", False)
-                fmt.Alignment = {
-                    "left": 0, "center": 1, "right": 2
-                }.get(params.get("paragraph_alignment", "left").lower(), 0)
+                fmt.LineSpacing = line_spacing
+                fmt.KeepWithNext = keep_with_next
+                fmt.Alignment = alignment
 
                 # --- Perform numbering fix ---
+                # Skip templates an earlier paragraph (or run) already
+                # patched; the reapply reflows numbering across the list
                 lvl = lt.ListLevels(3)
-                lvl.TrailingCharacter = C.wdTrailingNone
-                lvl.TabPosition = 0
-                lvl.TextPosition = lvl.NumberPosition
-                p.Range.ListFormat.ApplyListTemplateWithLevel(
-                    ListTemplate=lt,
-                    ContinuePreviousList=True,
-                    ApplyLevel=3,
-                )
+                number_pos = lvl.NumberPosition
+                if not (
+                    lvl.TrailingCharacter == C.wdTrailingNone
+                    and lvl.TabPosition == 0
+                    and lvl.TextPosition == number_pos
+                ):
+                    lvl.TrailingCharacter = C.wdTrailingNone
+                    lvl.TabPosition = 0
+                    lvl.TextPosition = number_pos
+                    lf.ApplyListTemplateWithLevel(
+                        ListTemplate=lt,
+                        ContinuePreviousList=True,
+                        ApplyLevel=3,
+                    )
 
                 count += 1
 
@@ -90,6 +120,3 @@ def follow_number_with_none_level3_py(
             "page_range": f"{page_start}-{page_end}",
             "count_updated": count,
         }
-
-    finally:
-        app.ScreenUpdating = True
@@ -5,15 +5,22 @@ without touching AOS, Appendices, or Schedules.
 """
 
 import re
+from functools import lru_cache
+
+from ...recipes_word._utils import compile_exclude_patterns, iter_paragraphs
+
+
+@lru_cache(maxsize=64)
+def _compile_detect(pattern: str) -> re.Pattern:
+    return re.compile(pattern)
+
 
 def tighten_level3_spacing_py(doc, log=None, **params):
     """
     Word recipe: tighten_level3_spacing
     """
-    import re
-
-    detect_pattern = re.compile(params.get("detect_pattern", r"^(\d+\.\d+\.\d+)"))
-    exclude_patterns = [re.compile(pat, re.I) for pat in params.get("exclude_patterns", [])]
+    detect_pattern = _compile_detect(params.get("detect_pattern", r"^(\d+\.\d+\.\d+)"))
+    exclude_patterns = compile_exclude_patterns(tuple(params.get("exclude_patterns", [])))
 
     spacing_before_pt = params.get("spacing_before_pt", 0)
     spacing_after_pt = params.get("spacing_after_pt", 0)
@@ -22,7 +29,7 @@ def tighten_level3_spacing_py(doc, log=None, **params):
     paragraph_alignment = params.get("paragraph_alignment", "left")
 
     count = 0
-    for para in doc.Paragraphs:
+    for para in iter_paragraphs(doc):
         text = para.Range.Text.strip()
         if not text:
             continue
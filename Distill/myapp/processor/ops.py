@@ -6,9 +6,10 @@ Now supports dynamic recipe discovery for Word-based formatters.
 import logging
 import importlib
 import pkgutil
-from typing import Any
+from typing import Any, Callable
 
 from .engines import Engine, WordComEngine  # type: ignore
+from .recipes_word._utils import invalidate_page_range_cache
 from .rules import Safety, Step
 
 logger = logging.getLogger(__name__)
@@ -57,12 +58,24 @@ logger.info(f"Discovered Word recipes: {list(RECIPE_REGISTRY.keys())}")
 # --- Core Engine Operations --------------------------------------------------
 
 def apply_steps(
-    engine: Engine, doc: Any, steps: list[Step], safety: Safety, log: logging.Logger
+    engine: Engine,
+    doc: Any,
+    steps: list[Step],
+    safety: Safety,
+    log: logging.Logger,
+    progress_cb: Callable[[int, int, str, dict[str, Any]], None] | None = None,
 ) -> dict[str, Any]:
+    """
+    Apply steps in order and return a summary of modifications.
+
+    progress_cb, if given, is called after each step as
+    progress_cb(step_idx, total_steps, step_name, step_result).
+    """
     summary: dict[str, Any] = {"steps": [], "total_modifications": 0}
+    total = len(steps)
 
     for step_idx, step in enumerate(steps, start=1):
-        log.info(f"Step {step_idx}/{len(steps)}: {step.name}")
+        log.info(f"Step {step_idx}/{total}: {step.name}")
 
         try:
             step_result = _apply_single_step(engine, doc, step, safety, log)
@@ -74,6 +87,9 @@ def apply_steps(
             log.error(f"Step '{step.name}' failed: {e}")
             raise RuntimeError(f"Step '{step.name}' failed: {e}") from e
 
+        if progress_cb:
+            progress_cb(step_idx, total, step.name, step_result)
+
     log.info(f"Completed {len(steps)} steps, {summary['total_modifications']} modifications")
     return summary
 
@@ -93,6 +109,8 @@ def _apply_single_step(
         try:
             count = _apply_action(engine, doc, ranges, action_type, action_config, safety, log)
             modifications += count
+            if count and action_type != "word_recipe":
+                invalidate_page_range_cache(doc)
         except Exception as e:
             log.error(f"  Action '{action_type}' failed: {e}")
             raise ValueError(f"Action '{action_type}' failed: {e}") from e
@@ -221,6 +239,11 @@ def _apply_action(
         result = fn(doc, **params)
         log.info("word_recipe '%s' result: %s", name, result)
 
+        # Cached page spans stay valid only while the layout is untouched;
+        # recipes have to say so explicitly (a zero count is not enough)
+        if not _recipe_left_doc_unchanged(result):
+            invalidate_page_range_cache(doc)
+
         mods = 1 if (isinstance(result, dict) and result.get("ok")) else 0
         try:
             if isinstance(result, dict) and "items_touched" in result:
@@ -230,3 +253,13 @@ def _apply_action(
         return mods
 
     raise ValueError(f"Unknown action type: {action_type}")
+
+
+def _recipe_left_doc_unchanged(result: Any) -> bool:
+    """
+    True when a recipe reports success with an explicit "unchanged": True.
+
+    count_updated is not a reliable signal: some recipes make edits they do
+    not count (e.g. ConvertNumbersToText in lists_dot_to_emdash).
+    """
+    return isinstance(result, dict) and bool(result.get("ok")) and result.get("unchanged") is True
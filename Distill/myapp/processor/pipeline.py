@@ -6,12 +6,14 @@ from __future__ import annotations
 
 import glob
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import List
 
 from . import __version__
 from .audit_export import Snapshot, compare, save_artifacts, write_audit_file
-from .engines import pick_engine, Engine
+from .engines import pick_engine, Engine, WordComEngine
 from .rules import load_rules
 from . import ops
 
@@ -51,7 +53,9 @@ def run(
     doc = None
     try:
         doc = engine.open_document(input_path)
-        pre = Snapshot.take(engine, doc)
+        # Snapshots walk the whole document; skip them when nothing consumes them
+        take_snapshots = write_audit or rules.safety.compare_pre_post
+        pre = Snapshot.take(engine, doc) if take_snapshots else None
 
         step_summary: dict = {}
         if dry_run:
@@ -60,7 +64,7 @@ def run(
             # Apply steps (uses your ops.py behavior)
             step_summary = ops.apply_steps(engine, doc, rules.steps, rules.safety, logger)
 
-        post = Snapshot.take(engine, doc)
+        post = Snapshot.take(engine, doc) if take_snapshots else None
         warnings = compare(pre, post, rules.safety, logger)
         for w in warnings:
             logger.warning("Warning: %s", w)
@@ -100,6 +104,17 @@ def run(
                 pass
 
 
+def _init_batch_worker(verbose: bool) -> None:
+    """Set up a batch worker process (each one drives its own Word instance)."""
+    logging.basicConfig(
+        level=logging.DEBUG if verbose else logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    # run_batch generated gen_py before starting the workers, which share
+    # it; only read it from here
+    WordComEngine.reset_gencache = False
+
+
 def run_batch(
     inputs: List[str | Path],
     rules_path: Path,
@@ -108,9 +123,13 @@ def run_batch(
     write_audit: bool,
     dry_run: bool,
     verbose: bool,
+    workers: int = 1,
 ) -> int:
     """
     Expand globs and run pipeline for each item. Aggregate exit codes.
+
+    With workers > 1 the files are spread over that many processes. Word
+    COM is apartment-threaded, so this uses processes rather than threads.
     """
     paths: list[Path] = []
     for item in inputs:
@@ -124,17 +143,36 @@ def run_batch(
         logging.getLogger("formatter").error("No inputs matched.")
         return 1
 
+    run_one = partial(
+        run,
+        rules_path=rules_path,
+        engine_hint=engine_hint,
+        base_out_dir=base_out_dir,
+        write_audit=write_audit,
+        dry_run=dry_run,
+        verbose=verbose,
+    )
+
+    workers = min(workers, len(paths))
+    if workers > 1:
+        if engine_hint != "libre":
+            # Build gen_py once, here, so the workers never generate into
+            # the shared folder at the same time
+            try:
+                WordComEngine.prepare_gencache()
+            except Exception as e:
+                logging.getLogger("formatter").warning("Could not prepare Word type library: %s", e)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_batch_worker,
+            initargs=(verbose,),
+        ) as pool:
+            codes = list(pool.map(run_one, paths))
+    else:
+        codes = [run_one(p) for p in paths]
+
     overall = 0
-    for p in paths:
-        code = run(
-            input_path=p,
-            rules_path=rules_path,
-            engine_hint=engine_hint,
-            base_out_dir=base_out_dir,
-            write_audit=write_audit,
-            dry_run=dry_run,
-            verbose=verbose,
-        )
+    for code in codes:
         if code != 0:
             overall = code
     return overall
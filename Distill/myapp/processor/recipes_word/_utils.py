@@ -1,8 +1,320 @@
 from __future__ import annotations
-from typing import Any
-from win32com.client import constants as C
+import hashlib
+import re
+from functools import lru_cache
+from typing import Any, Iterator
+from .engines import C
 
 PT_PER_CM = 28.3464567
+PT_PER_INCH = 72.0
+
+
+def to_twips(points: float) -> int:
+    """
+    Points to whole twips (1/20 pt), the unit Word stores lengths in.
+
+    Comparing twips is exact, so a value Word has already normalised always
+    compares equal to its target, unlike a float tolerance check.
+    """
+    return round(points * 20)
+
+
+def inches(x: float) -> float:
+    """Inches to points; what Application.InchesToPoints returns, without the COM call."""
+    return x * PT_PER_INCH
+
+# Resolved page spans, keyed by (id(doc), page_start, page_end) -> (start, end)
+_page_range_cache: dict[tuple[int, int, int], tuple[int, int]] = {}
+
+
+def get_page_range(doc: Any, page_start: int, page_end: int) -> tuple[int, int]:
+    """
+    Return (start, end) character offsets covering pages page_start..page_end.
+
+    GoTo forces Word to lay out the document, so the offsets are cached per
+    document and reused by every recipe that asks for the same page span.
+    """
+    key = (id(doc), page_start, page_end)
+    span = _page_range_cache.get(key)
+    if span is None:
+        start_rng = doc.GoTo(What=C.wdGoToPage, Which=C.wdGoToAbsolute, Count=page_start)
+        end_rng = doc.GoTo(What=C.wdGoToPage, Which=C.wdGoToAbsolute, Count=page_end + 1)
+        span = _page_range_cache[key] = (start_rng.Start, end_rng.Start)
+    return span
+
+
+# Page count per document, keyed by id(doc); cleared with the page spans
+_page_count_cache: dict[int, int] = {}
+
+
+def page_count(doc: Any) -> int:
+    """
+    Number of pages in the document.
+
+    ComputeStatistics forces Word to repaginate, so the count is cached per
+    document until invalidate_page_range_cache is called.
+    """
+    key = id(doc)
+    pages = _page_count_cache.get(key)
+    if pages is None:
+        pages = _page_count_cache[key] = doc.ComputeStatistics(C.wdStatisticPages)
+    return pages
+
+
+def page_window(doc: Any, page_start: int, page_end: int) -> Any:
+    """
+    Container whose paragraphs cover pages page_start..page_end.
+
+    Returns the document itself when the window spans every page (the
+    1..999 default), otherwise a Range; either can go to iter_paragraphs.
+    """
+    pages = page_count(doc)
+    if page_start <= 1 and page_end >= pages:
+        return doc
+    if page_end >= pages:
+        # GoTo past the last page lands on the last page; run to the end instead
+        start = get_page_range(doc, page_start, page_start)[0]
+        return doc.Range(start, doc.Content.End)
+    return doc.Range(*get_page_range(doc, page_start, page_end))
+
+
+# Page of the first match of an anchor heading, keyed by
+# (doc.FullName, doc.Content.End, text)
+_anchor_cache: dict[tuple[str, int, str], int | None] = {}
+
+
+def find_anchor_page(doc: Any, text: str) -> int | None:
+    """
+    Page number of the first case-insensitive match of text, or None.
+
+    The full-document Find is cached per document and length, so recipes
+    looking for the same heading share one search.
+    """
+    key = (doc.FullName, doc.Content.End, text)
+    if key in _anchor_cache:
+        return _anchor_cache[key]
+    r = doc.Content.Duplicate
+    f = r.Find
+    f.ClearFormatting()
+    found = f.Execute(FindText=text, MatchCase=False, MatchWildcards=False, Wrap=C.wdFindStop)
+    page = r.Information(C.wdActiveEndPageNumber) if found else None
+    _anchor_cache[key] = page
+    return page
+
+
+def invalidate_anchor_cache(doc: Any) -> None:
+    """Forget cached anchor pages for a document."""
+    name = doc.FullName
+    for key in [k for k in _anchor_cache if k[0] == name]:
+        del _anchor_cache[key]
+
+
+def invalidate_page_range_cache(doc: Any) -> None:
+    """Forget cached page spans, page count and anchor pages for a document (after edits or on close)."""
+    doc_id = id(doc)
+    for key in [k for k in _page_range_cache if k[0] == doc_id]:
+        del _page_range_cache[key]
+    _page_count_cache.pop(doc_id, None)
+    if _anchor_cache:
+        invalidate_anchor_cache(doc)
+
+
+def iter_collection(col: Any) -> Iterator[Any]:
+    """
+    Yield the items of a small Word COM collection by 1-based index.
+
+    Meant for collections like Sections, where Item(i) is cheap and Count
+    is read once. Do not use it for Paragraphs or ListParagraphs: Word
+    resolves Item(i) by counting from the start, so a full indexed walk is
+    quadratic; use iter_paragraphs or the collection's own enumerator.
+    """
+    for i in range(1, col.Count + 1):
+        yield col.Item(i)
+
+
+def iter_paragraphs(container: Any) -> Iterator[Any]:
+    """
+    Yield the paragraphs of a Document or Range, first to last.
+
+    Steps from Paragraphs.First with Paragraph.Next(), which is constant
+    time per paragraph. The count is read up front, so the walk stops at
+    the end of a Range rather than running on into the rest of the document.
+    """
+    paras = container.Paragraphs
+    n = paras.Count
+    if not n:
+        return
+    p = paras.First
+    for i in range(n):
+        yield p
+        if i + 1 < n:
+            p = p.Next()
+
+
+def position_of(rng: Any) -> str:
+    """
+    Start offset of a Range for error messages.
+
+    Only evaluated on the error path, and never raises, so a broken Range
+    cannot mask the exception being reported.
+    """
+    try:
+        return str(rng.Start)
+    except Exception:
+        return "?"
+
+
+def get_doc_property(doc: Any, name: str) -> str | None:
+    """Value of a custom document property, or None if it is not set."""
+    try:
+        return str(doc.CustomDocumentProperties(name).Value)
+    except Exception:
+        return None
+
+
+def set_doc_property(doc: Any, name: str, value: str) -> None:
+    """Create or overwrite a string custom document property."""
+    props = doc.CustomDocumentProperties
+    try:
+        props(name).Value = value
+    except Exception:
+        props.Add(Name=name, LinkToContent=False, Type=C.msoPropertyTypeString, Value=value)
+
+
+def has_list_paragraphs(doc: Any) -> bool:
+    """Single COM call telling list recipes whether there is anything to walk."""
+    return doc.Content.ListParagraphs.Count > 0
+
+
+NO_LIST_PARAGRAPHS = {"ok": True, "count_updated": 0, "unchanged": True, "skipped": "no_list_paragraphs"}
+
+
+class ListLevelCache:
+    """
+    Memoise ListTemplate.ListLevels(n) lookups and track reapplied levels.
+
+    win32com hands out a fresh wrapper on every property get, so id() of a
+    ListTemplate is not a stable key. Templates are instead matched with ==
+    (which compares the underlying IDispatch) and given a small integer key.
+    """
+
+    def __init__(self) -> None:
+        self._templates: list[Any] = []
+        self._levels: dict[tuple[int, int], Any] = {}
+        self._applied: set[tuple[int, int]] = set()
+
+    def key(self, list_template: Any, level_num: int) -> tuple[int, int]:
+        for i, known in enumerate(self._templates):
+            if known == list_template:
+                return (i, level_num)
+        self._templates.append(list_template)
+        return (len(self._templates) - 1, level_num)
+
+    def level(self, key: tuple[int, int]) -> Any:
+        lvl = self._levels.get(key)
+        if lvl is None:
+            lvl = self._levels[key] = self._templates[key[0]].ListLevels(key[1])
+        return lvl
+
+    def mark_applied(self, key: tuple[int, int]) -> bool:
+        """Record a reapply of key; False if it was already reapplied."""
+        if key in self._applied:
+            return False
+        self._applied.add(key)
+        return True
+
+
+def list_fingerprint(doc: Any) -> str:
+    """
+    Fingerprint of the document's list layout.
+
+    Covers the document length, every list paragraph's template, level and
+    left/first-line indent, and the positions, trailing character,
+    alignment and tab position of every list level in use, so a
+    formatting-only edit to any list paragraph or template changes it.
+    One pass over ListParagraphs; far cheaper than the recipes it guards.
+    """
+    levels = ListLevelCache()
+    level_state: dict[tuple[int, int], tuple] = {}
+    paras = []
+    # The enumerator, not Item(i), which counts from the start each time
+    for p in doc.Content.ListParagraphs:
+        lf = p.Range.ListFormat
+        key = levels.key(lf.ListTemplate, lf.ListLevelNumber)
+        if key not in level_state:
+            lvl = levels.level(key)
+            level_state[key] = (
+                to_twips(lvl.NumberPosition), to_twips(lvl.TextPosition),
+                lvl.TrailingCharacter, lvl.Alignment, lvl.TabPosition,
+            )
+        fmt = p.Format
+        paras.append((key, to_twips(fmt.LeftIndent), to_twips(fmt.FirstLineIndent)))
+    state = repr((doc.Content.End, paras, sorted(level_state.items())))
+    return hashlib.sha1(state.encode("utf-8")).hexdigest()
+
+
+class FastWord:
+    """
+    Context manager that switches off Word's reactive work during bulk edits.
+
+    Screen redraw, background repagination, as-you-type proofing, the status
+    bar, alerts, background/AutoRecover saves and revision tracking all run
+    after every property write. Prior values are saved on entry and restored
+    on exit.
+
+    With normal_view=True the document window is also switched to Normal view,
+    which avoids page layout entirely; resolve any page-based ranges before
+    entering in that case.
+    """
+
+    def __init__(self, doc: Any, normal_view: bool = False) -> None:
+        self.doc = doc
+        self.normal_view = normal_view
+        self._saved: list[tuple[Any, str, Any]] = []
+
+    def _set(self, obj: Any, name: str, value: Any) -> None:
+        try:
+            prior = getattr(obj, name)
+            setattr(obj, name, value)
+        except Exception:
+            return  # Not available in this Word build/view; leave as is
+        self._saved.append((obj, name, prior))
+
+    def __enter__(self) -> FastWord:
+        app = self.doc.Application
+        options = app.Options
+        self._set(app, "ScreenUpdating", False)
+        self._set(app, "DisplayStatusBar", False)
+        self._set(app, "DisplayAlerts", C.wdAlertsNone)
+        self._set(options, "Pagination", False)
+        self._set(options, "CheckSpellingAsYouType", False)
+        self._set(options, "CheckGrammarAsYouType", False)
+        self._set(options, "SaveInterval", 0)
+        self._set(options, "BackgroundSave", False)
+        self._set(self.doc, "TrackRevisions", False)
+        if self.normal_view:
+            try:
+                view = self.doc.ActiveWindow.View
+            except Exception:
+                view = None  # Invisible/windowless document
+            if view is not None:
+                self._set(view, "Type", C.wdNormalView)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        while self._saved:
+            obj, name, prior = self._saved.pop()
+            try:
+                setattr(obj, name, prior)
+            except Exception:
+                pass
+        return False
+
+
+@lru_cache(maxsize=64)
+def compile_exclude_patterns(patterns: tuple[str, ...]) -> tuple[re.Pattern, ...]:
+    """Case-insensitive exclude patterns, compiled once per distinct tuple."""
+    return tuple(re.compile(p, re.I) for p in patterns)
 
 
 def looks_like_manual_number(para) -> bool:
@@ -28,17 +340,20 @@ def looks_like_manual_number(para) -> bool:
 
 def replace_in_para(para, find_pat: str, repl: str) -> None:
     """Wildcard-safe replace inside a paragraph."""
-    r = para.Range.Duplicate
-    f = r.Find
+    f = para.Range.Duplicate.Find
     f.ClearFormatting()
     f.Replacement.ClearFormatting()
-    f.Text = find_pat
-    f.Replacement.Text = repl
-    f.MatchWildcards = True
-    f.MatchCase = False
-    f.Wrap = C.wdFindStop
-    f.Format = False
-    f.Execute(Replace=C.wdReplaceAll)
+    # Options go in the one Execute call; each Find property set would be
+    # a COM round trip of its own
+    f.Execute(
+        FindText=find_pat,
+        MatchCase=False,
+        MatchWildcards=True,
+        Wrap=C.wdFindStop,
+        Format=False,
+        ReplaceWith=repl,
+        Replace=C.wdReplaceAll,
+    )
 
 
 def remove_all_spaces_after_dash(para) -> None:
@@ -1,6 +1,56 @@
 from __future__ import annotations
+import re
 from typing import Any
-from win32com.client import constants as C
+from .engines import C
+from ._utils import FastWord
+
+# Paragraph start (document start or just after a paragraph mark), then a
+# non-space character, then an em dash
+_EMDASH_RE = re.compile(r"(?:\A|(?<=\r))[^ \r]\u2014")
+
+def _starts_from_text(doc: Any) -> list[int] | None:
+    """
+    Paragraph-start offsets of '<non-space>—' paragraphs, scanned in Python.
+
+    Fetches doc.Content.Text once instead of one Range.Text per paragraph.
+    Returns None when the text offsets cannot be trusted to match Range
+    offsets (e.g. table cell markers or fields), so the caller can fall back.
+    """
+    content = doc.Content
+    full = content.Text
+    if len(full) != content.End - content.Start:
+        return None
+
+    starts = [m.start() for m in _EMDASH_RE.finditer(full)]
+
+    # Cheap per-hit check that the offsets line up with the document
+    for start in starts:
+        if doc.Range(start, start + 2).Text != full[start:start + 2]:
+            return None
+    return starts
+
+
+def _starts_from_find(doc: Any) -> list[int]:
+    """Paragraph-start offsets of '<non-space>—' paragraphs via one wildcard Find."""
+    starts = []
+    head = doc.Range(0, 2).Text
+    if len(head) >= 2 and head[0] not in (' ', '\r') and ord(head[1]) == 0x2014:
+        starts.append(0)
+
+    # Paragraph mark + non-space + em dash
+    rng = doc.Content.Duplicate
+    f = rng.Find
+    f.ClearFormatting()
+    f.Text = "^13[!^13 ]\u2014"
+    f.MatchWildcards = True
+    f.Forward = True
+    f.Wrap = C.wdFindStop
+    f.Format = False
+    while f.Execute():
+        starts.append(rng.Start + 1)
+        rng.Collapse(C.wdCollapseEnd)
+    return starts
+
 
 def add_space_before_emdash_paragraphs_py(doc: Any) -> dict:
     """
@@ -19,7 +69,6 @@ def add_space_before_emdash_paragraphs_py(doc: Any) -> dict:
     """
     try:
         app = doc.Application
-        app.ScreenUpdating = False
         changed = 0
         errors = []
         
@@ -27,25 +76,23 @@ def add_space_before_emdash_paragraphs_py(doc: Any) -> dict:
         initial_start = app.Selection.Start
         initial_end = app.Selection.End
         
-        # Process each paragraph in the document
-        for para in doc.Paragraphs:
-            try:
-                txt = para.Range.Text
-                
-                # Ensure the paragraph has at least two characters
-                if len(txt) >= 2:
-                    # Check if second character is an em dash (Unicode 8212 / chr(8212))
-                    # In Python: chr(8212) = '—'
-                    if txt[1] == '\u2014' or txt[1] == '—':
-                        # Check if paragraph doesn't already start with a space
-                        if txt[0] != ' ':
-                            # Insert a space at the beginning
-                            para.Range.InsertBefore(" ")
-                            changed += 1
-                        
-            except Exception as e:
-                errors.append(f"Error processing paragraph at position {para.Range.Start}: {str(e)}")
-        
+        # Every insert triggers a relayout; suspend it until all are done
+        with FastWord(doc):
+            starts = _starts_from_text(doc)
+            if starts is None:
+                starts = _starts_from_find(doc)
+
+            # Insert back to front so earlier offsets stay valid. A wildcard
+            # ReplaceAll cannot be used: the match has to start at the previous
+            # paragraph mark (Word wildcards have no lookbehind), and replacing
+            # that mark drops the previous paragraph's formatting.
+            for start in reversed(starts):
+                try:
+                    doc.Range(start, start).InsertBefore(" ")
+                    changed += 1
+                except Exception as e:
+                    errors.append(f"Error processing paragraph at position {start}: {str(e)}")
+
         # Restore original selection
         app.Selection.SetRange(initial_start, initial_end)
         
@@ -67,6 +114,3 @@ def add_space_before_emdash_paragraphs_py(doc: Any) -> dict:
             "ok": False,
             "error": str(e)
         }
-    
-    finally:
-        app.ScreenUpdating = True
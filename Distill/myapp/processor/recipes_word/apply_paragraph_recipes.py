@@ -0,0 +1,70 @@
+"""
+Word automation recipe that runs the paragraph-level recipes as one unit.
+
+Covers enforce_list_left_indents_level1to3, enforce_numeric_alignment_all_lists
+and add_space_before_emdash_paragraphs under a single FastWord context: the
+two list recipes share one paragraph walk (via fused_list_formatting) and the
+em-dash spacing works from one Content.Text fetch.
+"""
+
+from __future__ import annotations
+from typing import Any
+from ._utils import FastWord, page_window
+# Import the modules, not the *_py functions: ops.discover_word_recipes
+# registers every *_py attribute it finds in a recipe module
+from . import add_space_before_emdash_paragraphs as _emdash
+from . import fused_list_formatting as _fused
+
+
+def apply_paragraph_recipes_py(doc: Any, page_start: int = 1, page_end: int = 999) -> dict:
+    """
+    Apply list indents, numeric alignment and em-dash spacing in one pass.
+
+    Sub-recipes run in the same order as in the default rules (list
+    formatting first, em-dash spacing last). The list part skips the walk
+    when its stored fingerprint shows a whole-document run already
+    normalised the document (see fused_list_formatting).
+
+    Args:
+        doc: Word document object
+        page_start: First page numeric alignment applies to (default: 1)
+        page_end: Last page numeric alignment applies to (default: 999)
+
+    Returns:
+        dict: Merged result; per-recipe results are kept under "results"
+    """
+    # Resolve (and cache) the page window before pagination is suspended
+    page_window(doc, page_start, page_end)
+
+    with FastWord(doc):
+        results = {
+            "enforce_list_left_indents_level1to3+enforce_numeric_alignment_all_lists":
+                _fused.fused_list_formatting_py(
+                    doc, mode="left_indents+numeric", page_start=page_start, page_end=page_end,
+                ),
+            "add_space_before_emdash_paragraphs":
+                _emdash.add_space_before_emdash_paragraphs_py(doc),
+        }
+
+    failed = [name for name, res in results.items() if not res.get("ok")]
+    changed = sum(res.get("count_updated", 0) for res in results.values())
+    warnings = [w for res in results.values() for w in res.get("warnings", [])]
+
+    result = {
+        "ok": not failed,
+        "count_updated": changed,
+        "description": f"Applied paragraph recipes ({changed} update(s))",
+        "results": results,
+    }
+    if all(res.get("unchanged") for res in results.values()):
+        result["unchanged"] = True
+    if failed:
+        result["error"] = "; ".join(
+            f"{name}: {results[name].get('error', 'failed')}" for name in failed
+        )
+    if warnings:
+        result["warnings"] = warnings[:10]
+        if len(warnings) > 10:
+            result["warnings"].append(f"... and {len(warnings) - 10} more errors")
+
+    return result
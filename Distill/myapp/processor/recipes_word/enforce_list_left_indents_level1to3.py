@@ -1,6 +1,19 @@
 from __future__ import annotations
 from typing import Any
-from win32com.client import constants as C
+from .engines import C
+from ._utils import (
+    NO_LIST_PARAGRAPHS, FastWord, ListLevelCache, get_doc_property, has_list_paragraphs,
+    inches, iter_paragraphs, list_fingerprint, position_of, set_doc_property, to_twips,
+)
+
+# Left indent per list level: 0.3in, 0.6in, 0.9in
+TARGET_INDENT = {i: inches(0.3 * i) for i in (1, 2, 3)}
+TARGET_TWIPS = {i: to_twips(pt) for i, pt in TARGET_INDENT.items()}
+
+# Custom document property holding the fingerprint of the last normalised
+# state; v3 fingerprints cover every list paragraph, not a sample
+FINGERPRINT_PROPERTY = "akn_lists_indent_hash_v3"
+
 
 def enforce_list_left_indents_level1to3_py(doc: Any) -> dict:
     """
@@ -9,64 +22,98 @@ def enforce_list_left_indents_level1to3_py(doc: Any) -> dict:
     - Level 2: 0.6 inches
     - Level 3: 0.9 inches
     Also removes spaces after numbers and aligns text with numbers.
+
+    Kept for single-rule runs; the default rules.yaml runs this together
+    with the other list fixes through fused_list_formatting.
     """
-    app = doc.Application
-    app.ScreenUpdating = False
+    if not has_list_paragraphs(doc):
+        return dict(NO_LIST_PARAGRAPHS)
+
+    # Already normalised by a previous run and untouched since (the
+    # fingerprint is a full list pass, so only computed if one was stored)
+    stored = get_doc_property(doc, FINGERPRINT_PROPERTY)
+    if stored is not None and stored == list_fingerprint(doc):
+        return {"ok": True, "count_updated": 0, "unchanged": True, "cached": True}
+
     changed = 0
     errors = []
 
-    try:
-        inches_to_points = app.InchesToPoints
+    with FastWord(doc):
+        levels = ListLevelCache()
 
-        for para in doc.Paragraphs:
+        # Snapshot the paragraphs first so template reapplies inside the
+        # loop cannot shift the live collection under the iteration
+        paras = list(iter_paragraphs(doc))
+        for para in paras:
+            # Read-only queries: work out the target and whether anything differs
             try:
-                lf = para.Range.ListFormat
-                if lf.ListType != C.wdListNoNumbering:
-                    level_num = lf.ListLevelNumber
-
-                    if 1 <= level_num <= 3:
-                        try:
-                            list_template = lf.ListTemplate
-                            lvl = list_template.ListLevels(level_num)
-
-                            # Set NumberPosition and TextPosition depending on list level
-                            target_indent = inches_to_points(level_num * 0.3)
-                            
-                            # Check if update needed
-                            needs_update = (
-                                abs(lvl.NumberPosition - target_indent) > 0.1 or
-                                abs(lvl.TextPosition - target_indent) > 0.1 or
-                                lvl.TrailingCharacter != C.wdTrailingNone or
-                                abs(para.Format.LeftIndent - target_indent) > 0.1
-                            )
-                            
-                            if needs_update:
-                                lvl.NumberPosition = target_indent
-                                lvl.TextPosition = target_indent
-
-                                # Remove tab/space after number
-                                lvl.TrailingCharacter = C.wdTrailingNone
-                                # Keep text and number aligned
-                                lvl.TabPosition = C.wdUndefined
-
-                                # Match paragraph indent to level depth
-                                para.Format.LeftIndent = target_indent
-                                para.Format.FirstLineIndent = 0
-
-                                # Reapply list formatting to ensure changes take effect
-                                para.Range.ListFormat.ApplyListTemplateWithLevel(
-                                    ListTemplate=list_template,
-                                    ContinuePreviousList=True,
-                                    ApplyTo=C.wdListApplyToWholeList,
-                                    ApplyLevel=level_num
-                                )
-                                changed += 1
-
-                        except Exception as e:
-                            errors.append(f"Error processing list level at position {para.Range.Start}: {str(e)}")
+                rng = para.Range
+                lf = rng.ListFormat
+                if lf.ListType == C.wdListNoNumbering:
+                    continue
+                level_num = lf.ListLevelNumber
+                if not 1 <= level_num <= 3:
+                    continue
 
+                list_template = lf.ListTemplate
+                key = levels.key(list_template, level_num)
+                lvl = levels.level(key)
+                fmt = para.Format
+
+                # Set NumberPosition and TextPosition depending on list level
+                target_indent = TARGET_INDENT[level_num]
+                target_tw = TARGET_TWIPS[level_num]
+
+                # Check if update needed
+                level_differs = (
+                    to_twips(lvl.NumberPosition) != target_tw or
+                    to_twips(lvl.TextPosition) != target_tw or
+                    lvl.TrailingCharacter != C.wdTrailingNone
+                )
+                indent_differs = to_twips(fmt.LeftIndent) != target_tw
             except Exception as e:
                 errors.append(f"Error processing paragraph: {str(e)}")
+                continue
+
+            if not (level_differs or indent_differs):
+                continue
+
+            # Mutations
+            try:
+                if level_differs:
+                    lvl.NumberPosition = target_indent
+                    lvl.TextPosition = target_indent
+
+                    # Remove tab/space after number
+                    lvl.TrailingCharacter = C.wdTrailingNone
+                    # Keep text and number aligned
+                    lvl.TabPosition = C.wdUndefined
+
+                # Match paragraph indent to level depth
+                fmt.LeftIndent = target_indent
+                fmt.FirstLineIndent = 0
+
+                # Reapply list formatting to ensure changes take effect.
+                # ApplyTo=wdListApplyToWholeList covers every paragraph
+                # sharing this template level, so once is enough.
+                if levels.mark_applied(key):
+                    lf.ApplyListTemplateWithLevel(
+                        ListTemplate=list_template,
+                        ContinuePreviousList=True,
+                        ApplyTo=C.wdListApplyToWholeList,
+                        ApplyLevel=level_num
+                    )
+                changed += 1
+
+            except Exception as e:
+                errors.append(f"Error processing list level at position {position_of(rng)}: {str(e)}")
+
+        # Remember the normalised state so a re-run can return straight away
+        if not errors:
+            try:
+                set_doc_property(doc, FINGERPRINT_PROPERTY, list_fingerprint(doc))
+            except Exception as e:
+                errors.append(f"Could not store list fingerprint: {str(e)}")
 
         result = {
             "ok": True,
@@ -74,12 +121,13 @@ def enforce_list_left_indents_level1to3_py(doc: Any) -> dict:
             "description": f"Adjusted {changed} list paragraph(s) for Level 1-3 indents"
         }
 
+        # Every write is counted, so nothing counted means nothing changed
+        if not changed and not errors:
+            result["unchanged"] = True
+
         if errors:
             result["warnings"] = errors[:10]
             if len(errors) > 10:
                 result["warnings"].append(f"... and {len(errors) - 10} more errors")
 
         return result
-
-    finally:
-        app.ScreenUpdating = True
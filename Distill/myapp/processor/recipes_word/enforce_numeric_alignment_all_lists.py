@@ -3,7 +3,16 @@ Word automation recipe to enforce numeric alignment in lists.
 Ensures consistent spacing and alignment of numbers in multilevel lists.
 """
 
-from win32com.client import constants as C
+from .engines import C
+from ._utils import NO_LIST_PARAGRAPHS, FastWord, ListLevelCache, has_list_paragraphs, inches, iter_paragraphs, page_window, to_twips
+
+# Numeric alignment columns
+NUM_POS = {
+    1: inches(0.5),  # Level 1 number column
+    2: inches(0.8),  # Level 2 number column
+    3: inches(1.1),  # Level 3 number column
+}
+GAP = inches(0.1)    # small space between number and text
 
 def enforce_numeric_alignment_all_lists_py(doc, page_start=1, page_end=999, **_):
     """
@@ -17,6 +26,9 @@ def enforce_numeric_alignment_all_lists_py(doc, page_start=1, page_end=999, **_)
     Returns:
         dict: Results with ok/error status and count of changes
     """
+    if not has_list_paragraphs(doc):
+        return dict(NO_LIST_PARAGRAPHS)
+
     try:
         # Get Word application instance
         app = doc.Application
@@ -25,61 +37,72 @@ def enforce_numeric_alignment_all_lists_py(doc, page_start=1, page_end=999, **_)
         initial_start = app.Selection.Start
         initial_end = app.Selection.End
         
-        app.ScreenUpdating = False
         errors = []
         changed = 0
 
-        # Define numeric alignment columns
-        inches_to_points = app.InchesToPoints
-        numPos = {
-            1: inches_to_points(0.5),  # Level 1 number column
-            2: inches_to_points(0.8),  # Level 2 number column
-            3: inches_to_points(1.1),  # Level 3 number column
-        }
-        gap = inches_to_points(0.1)    # small space between number and text
+        trailing = C.wdTrailingNone if GAP == 0 else C.wdTrailingTab
+        # (NumberPosition, TextPosition) targets per level
+        targets = {n: (pos, pos + GAP) for n, pos in NUM_POS.items()}
+        # ListLevel objects belong to the template, not the paragraph, so each
+        # (template, level) pair only needs normalising once
+        levels = ListLevelCache()
 
-        # Loop through all paragraphs
-        for para in doc.Paragraphs:
-            try:
-                lf = para.Range.ListFormat
-                if lf.ListType != C.wdListNoNumbering:
+        # Only walk the requested pages; resolved before pagination is suspended
+        window = page_window(doc, page_start, page_end)
+
+        # Loop through all paragraphs with Word's reactive work suspended
+        with FastWord(doc):
+            # Snapshot the paragraphs first so template reapplies inside the
+            # loop cannot shift the live collection under the iteration
+            paras = list(iter_paragraphs(window))
+            for para in paras:
+                try:
+                    lf = para.Range.ListFormat
+                    if lf.ListType == C.wdListNoNumbering:
+                        continue
                     level_num = lf.ListLevelNumber
+                except Exception:
+                    # Skip non-list paragraphs silently
+                    continue
+                if not 1 <= level_num <= 3:
+                    continue
+
+                try:
+                    list_template = lf.ListTemplate
+                    key = levels.key(list_template, level_num)
+                    if not levels.mark_applied(key):
+                        continue  # already handled via an earlier paragraph
+                    lvl = levels.level(key)
+
+                    number_pos, text_pos = targets[level_num]
 
-                    if 1 <= level_num <= 3:
-                        try:
-                            list_template = lf.ListTemplate
-                            lvl = list_template.ListLevels(level_num)
-
-                            # Check if update needed
-                            needs_update = (
-                                lvl.Alignment != C.wdListLevelAlignRight or
-                                abs(lvl.NumberPosition - numPos[level_num]) > 0.1 or
-                                abs(lvl.TextPosition - (numPos[level_num] + gap)) > 0.1
-                            )
-                            
-                            if needs_update:
-                                # --- Key alignment rule ---
-                                lvl.Alignment = C.wdListLevelAlignRight
-                                lvl.NumberPosition = numPos[level_num]
-                                lvl.TextPosition = numPos[level_num] + gap
-                                lvl.TrailingCharacter = (
-                                    C.wdTrailingNone if gap == 0 else C.wdTrailingTab
-                                )
-                                lvl.TabPosition = C.wdUndefined
-
-                                # Reapply list template to ensure changes take effect
-                                para.Range.ListFormat.ApplyListTemplateWithLevel(
-                                    ListTemplate=list_template,
-                                    ContinuePreviousList=True,
-                                    ApplyTo=C.wdListApplyToWholeList,
-                                    ApplyLevel=level_num
-                                )
-                                changed += 1
-                        except Exception as e:
-                            errors.append(f"Error processing list level {level_num}: {str(e)}")
-            except Exception as e:
-                # Skip non-list paragraphs silently
-                pass
+                    # Skip levels that are already aligned; this also avoids
+                    # the ApplyListTemplateWithLevel call, which repaginates
+                    if (
+                        lvl.Alignment == C.wdListLevelAlignRight and
+                        to_twips(lvl.NumberPosition) == to_twips(number_pos) and
+                        to_twips(lvl.TextPosition) == to_twips(text_pos) and
+                        lvl.TrailingCharacter == trailing
+                    ):
+                        continue
+
+                    # --- Key alignment rule ---
+                    lvl.Alignment = C.wdListLevelAlignRight
+                    lvl.NumberPosition = number_pos
+                    lvl.TextPosition = text_pos
+                    lvl.TrailingCharacter = trailing
+                    lvl.TabPosition = C.wdUndefined
+
+                    # Reapply list template to ensure changes take effect
+                    lf.ApplyListTemplateWithLevel(
+                        ListTemplate=list_template,
+                        ContinuePreviousList=True,
+                        ApplyTo=C.wdListApplyToWholeList,
+                        ApplyLevel=level_num
+                    )
+                    changed += 1
+                except Exception as e:
+                    errors.append(f"Error processing list level {level_num}: {str(e)}")
 
         # Restore original selection
         app.Selection.SetRange(initial_start, initial_end)
@@ -90,6 +113,10 @@ def enforce_numeric_alignment_all_lists_py(doc, page_start=1, page_end=999, **_)
             "description": f"Adjusted numeric alignment in {changed} list paragraphs"
         }
 
+        # Every write is counted, so nothing counted means nothing changed
+        if not changed and not errors:
+            result["unchanged"] = True
+
         if errors:
             result["warnings"] = errors
 
@@ -100,7 +127,3 @@ def enforce_numeric_alignment_all_lists_py(doc, page_start=1, page_end=999, **_)
             "ok": False,
             "error": str(e)
         }
-
-    finally:
-        app.ScreenUpdating = True
-
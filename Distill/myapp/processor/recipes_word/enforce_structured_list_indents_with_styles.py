@@ -1,12 +1,92 @@
 from __future__ import annotations
-from typing import Any
-import win32com.client
-from win32com.client import constants as C
-import pythoncom
-import re
+from typing import Any, Iterator
+import string
+from ._utils import inches, iter_paragraphs
+
+# Microsoft Word Object Library (same typelib WordComEngine generates)
+WORD_TYPELIB = ("{00020905-0000-0000-C000-000000000046}", 0, 8, 7)
+
+_CONSTANTS_READY = False
+
+
+def _ensure_word_constants() -> None:
+    """
+    Make sure the Word type library is generated so C.* resolves.
+
+    Done on first use rather than at import, and from the type library
+    rather than via EnsureDispatch, which would start a Word process.
+    """
+    global _CONSTANTS_READY
+    if _CONSTANTS_READY:
+        return
+    import win32com.client
+    win32com.client.gencache.EnsureModule(*WORD_TYPELIB)
+    _CONSTANTS_READY = True
+
+
+_ASCII_LETTERS = frozenset(string.ascii_letters)
+
+# Characters of paragraph text looked at; markers are only a few long, so
+# long paragraphs are never copied or stripped in full
+_HEAD = 16
+
+
+def _classify(text: str) -> str | None:
+    """
+    Legal list marker level of left-stripped paragraph text, using plain
+    character tests: "1." -> "L1", "(1)" -> "L2", "(a)" -> "L3", else None.
+    """
+    n = len(text)
+    if not n:
+        return None
+    c0 = text[0]
+    if c0.isdecimal():
+        i = 1
+        while i < n and text[i].isdecimal():
+            i += 1
+        return "L1" if i < n and text[i] == "." else None
+    if c0 == "(" and n >= 3:
+        c1 = text[1]
+        if c1.isdecimal():
+            i = 2
+            while i < n and text[i].isdecimal():
+                i += 1
+            return "L2" if i < n and text[i] == ")" else None
+        if c1 in _ASCII_LETTERS and text[2] == ")":
+            return "L3"
+    return None
+
+
+def _list_candidates(doc: Any) -> Iterator[tuple[Any, str, str]]:
+    """
+    Yield (paragraph, text, level) for paragraphs carrying a legal list marker.
+
+    Classifies from one Content.Text fetch and only resolves a paragraph
+    object for the hits; falls back to reading each paragraph when the
+    text offsets do not line up with document positions.
+    """
+    content = doc.Content
+    full = content.Text
+    if len(full) == content.End - content.Start:
+        offset = content.Start
+        for seg in full.split("\r"):
+            # Table cell paragraphs follow a "\x07" end-of-cell mark
+            head = seg[:_HEAD]
+            text = head.lstrip("\x07")
+            lead = len(head) - len(text)
+            text = text.lstrip()
+            level = _classify(text)
+            if level is not None:
+                yield doc.Range(offset + lead, offset + lead).Paragraphs(1), text, level
+            offset += len(seg) + 1
+        return
+
+    for para in iter_paragraphs(doc):
+        text = (para.Range.Text or "")[:_HEAD].lstrip()
+        level = _classify(text)
+        if level is not None:
+            yield para, text, level
 
-# Ensure constants are properly initialized
-_ = win32com.client.gencache.EnsureDispatch("Word.Application")
 
 def enforce_structured_list_indents_with_styles_py(doc: Any) -> dict:
     """
@@ -15,6 +95,10 @@ def enforce_structured_list_indents_with_styles_py(doc: Any) -> dict:
     - Corresponding paragraph styles ("List Level 1", "List Level 2", "List Level 3")
     Keeps text and formatting intact.
     """
+    # pywin32 is imported here so the marker classifier imports without it
+    import pythoncom
+    from win32com.client import constants as C
+
     # Initialize COM for this thread
     pythoncom.CoInitialize()
     app = None
@@ -22,10 +106,11 @@ def enforce_structured_list_indents_with_styles_py(doc: Any) -> dict:
     errors = []
     
     try:
+        _ensure_word_constants()
+
         # Initialize Word application
         app = doc.Application
         app.ScreenUpdating = False
-        inches_to_points = app.InchesToPoints
 
         # Ensure styles exist (create if missing)
         def get_or_create_style(style_name: str, base_indent_inch: float):
@@ -33,7 +118,7 @@ def enforce_structured_list_indents_with_styles_py(doc: Any) -> dict:
                 style = doc.Styles(style_name)
             except Exception:
                 style = doc.Styles.Add(Name=style_name, Type=C.wdStyleTypeParagraph)
-                style.ParagraphFormat.LeftIndent = inches_to_points(base_indent_inch)
+                style.ParagraphFormat.LeftIndent = inches(base_indent_inch)
                 style.ParagraphFormat.FirstLineIndent = 0
             return style
 
@@ -41,32 +126,25 @@ def enforce_structured_list_indents_with_styles_py(doc: Any) -> dict:
         style_level2 = get_or_create_style("List Level 2", 0.3)
         style_level3 = get_or_create_style("List Level 3", 0.6)
 
-        for para in doc.Paragraphs:
-            text = para.Range.Text.strip()
+        # (indent, style, style name) per marker level; the names are read
+        # once here instead of once per paragraph
+        level_targets = {
+            "L1": (inches(0.0), style_level1, style_level1.NameLocal),  # e.g. 4. 5. 6.
+            "L2": (inches(0.3), style_level2, style_level2.NameLocal),  # e.g. (1), (2)
+            "L3": (inches(0.6), style_level3, style_level3.NameLocal),  # e.g. (a), (b)
+        }
 
+        # Snapshot the hits first; restyling must not disturb the text scan
+        for para, text, level in list(_list_candidates(doc)):
             try:
-                # Detect level based on numbering pattern
-                if re.match(r'^\d+\.', text):  
-                    # e.g. 4. 5. 6.
-                    target_indent = inches_to_points(0.0)
-                    target_style = style_level1
-                elif re.match(r'^\(\d+\)', text):  
-                    # e.g. (1), (2)
-                    target_indent = inches_to_points(0.3)
-                    target_style = style_level2
-                elif re.match(r'^\([a-z]\)', text, re.I):  
-                    # e.g. (a), (b)
-                    target_indent = inches_to_points(0.6)
-                    target_style = style_level3
-                else:
-                    continue  # not a list paragraph we manage
+                target_indent, target_style, target_name = level_targets[level]
 
                 fmt = para.Format
                 needs_indent_update = (
                     abs(fmt.LeftIndent - target_indent) > 0.1 or
                     abs(fmt.FirstLineIndent) > 0.1
                 )
-                needs_style_update = para.Style.NameLocal != target_style.NameLocal
+                needs_style_update = para.Style.NameLocal != target_name
 
                 if needs_indent_update or needs_style_update:
                     para.Style = target_style
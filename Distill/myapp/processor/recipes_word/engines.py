@@ -5,9 +5,13 @@ Word COM engine constants for recipe functions.
 class C:
     """Word COM constants."""
     wdListNoNumbering = 0
+    wdListApplyToWholeList = 0
+    wdListLevelAlignLeft = 0
     wdListLevelAlignRight = 2
-    wdTrailingNone = 0
-    wdTrailingTab = 1
+    wdListNumberStyleArabic = 0
+    wdTrailingTab = 0
+    wdTrailingSpace = 1
+    wdTrailingNone = 2
     wdUndefined = 9999999
     
     # Find/Replace constants
@@ -21,13 +25,25 @@ class C:
 
     # View/Display constants
     wdAlertsNone = 0
+    wdNormalView = 1
     wdCollapseEnd = 0
     wdCollapseStart = 1
     wdParagraph = 4
     wdExtend = 1
+
+    # Paragraph/style constants
+    wdAlignParagraphLeft = 0
+    wdStyleTypeParagraph = 1
     
     # Navigation constants
     wdGoToPage = 1
     wdGoToAbsolute = 1
     wdGoToNext = 2
-    wdGoToPrevious = 3
\ No newline at end of file
+    wdGoToPrevious = 3
+    wdActiveEndPageNumber = 3
+
+    # Statistics constants
+    wdStatisticPages = 2
+
+    # Office (mso) constants
+    msoPropertyTypeString = 4
\ No newline at end of file
@@ -0,0 +1,216 @@
+"""
+Word automation recipe that fuses the list-level formatting recipes.
+
+Runs the work of no_space_after_number_all_lists_fix,
+enforce_list_left_indents_level1to3 and enforce_numeric_alignment_all_lists
+in a single paragraph walk, fetching each paragraph's list level once.
+The default rules.yaml runs the first two through this recipe.
+"""
+
+from __future__ import annotations
+from typing import Any
+from .engines import C
+from ._utils import (
+    NO_LIST_PARAGRAPHS, FastWord, ListLevelCache, get_doc_property, has_list_paragraphs,
+    iter_paragraphs, list_fingerprint, page_window, set_doc_property, to_twips,
+)
+from .enforce_list_left_indents_level1to3 import TARGET_INDENT
+from .enforce_numeric_alignment_all_lists import GAP, NUM_POS
+
+# Canonical order, matching the order the individual recipes run in rules.yaml.
+# Later transformations win where they set the same ListLevel property.
+MODES = ("no_space", "left_indents", "numeric")
+
+# Custom document property prefix for the fingerprint of a whole-document
+# run; the canonical mode string is appended, one property per mode set
+FINGERPRINT_PREFIX = "akn_lists_fused_hash_v3"
+
+
+def _parse_mode(mode: str) -> set[str]:
+    requested = {m.strip() for m in mode.split("+") if m.strip()}
+    unknown = requested - set(MODES)
+    if unknown:
+        raise ValueError(f"Unknown mode(s) {sorted(unknown)}; expected any of {MODES}")
+    return requested
+
+
+def _differs(current: Any, target: Any) -> bool:
+    if isinstance(target, float):
+        return to_twips(current) != to_twips(target)
+    return current != target
+
+
+def _level_target(lvl: Any, level_num: int, modes: set[str]) -> dict[str, Any]:
+    """Final ListLevel state after every requested transformation."""
+    in_band = 1 <= level_num <= 3
+    target: dict[str, Any] = {}
+    if "no_space" in modes:
+        target.update(
+            TrailingCharacter=C.wdTrailingNone,
+            TextPosition=lvl.NumberPosition,
+            TabPosition=C.wdUndefined,
+        )
+    if "left_indents" in modes and in_band:
+        target.update(
+            NumberPosition=TARGET_INDENT[level_num],
+            TextPosition=TARGET_INDENT[level_num],
+            TrailingCharacter=C.wdTrailingNone,
+            TabPosition=C.wdUndefined,
+        )
+    if "numeric" in modes and in_band:
+        target.update(
+            Alignment=C.wdListLevelAlignRight,
+            NumberPosition=NUM_POS[level_num],
+            TextPosition=NUM_POS[level_num] + GAP,
+            TrailingCharacter=C.wdTrailingNone if GAP == 0 else C.wdTrailingTab,
+            TabPosition=C.wdUndefined,
+        )
+    return target
+
+
+def _fingerprint_property(modes: set[str]) -> str:
+    return f"{FINGERPRINT_PREFIX}_{'+'.join(m for m in MODES if m in modes)}"
+
+
+def fused_list_formatting_py(
+    doc: Any,
+    mode: str = "left_indents+numeric+no_space",
+    page_start: int = 1,
+    page_end: int = 999,
+) -> dict:
+    """
+    Apply the requested list formatting transformations in one pass.
+
+    Args:
+        doc: Word document object
+        mode: '+'-separated subset of "no_space", "left_indents", "numeric".
+              Transformations are always applied in pipeline order
+              (no_space, left_indents, numeric) regardless of how they are listed.
+        page_start: First page numeric alignment applies to (default: 1)
+        page_end: Last page numeric alignment applies to (default: 999);
+              as with enforce_numeric_alignment_all_lists, only numeric is
+              limited to the window
+
+    Returns:
+        dict: Result with count of list levels and paragraph indents updated
+    """
+    try:
+        modes = _parse_mode(mode)
+    except ValueError as e:
+        return {"ok": False, "error": str(e)}
+
+    if not has_list_paragraphs(doc):
+        return dict(NO_LIST_PARAGRAPHS)
+
+    # Character span numeric alignment is limited to; None for the whole
+    # document. Resolved before pagination is suspended.
+    numeric_span = None
+    if "numeric" in modes:
+        window = page_window(doc, page_start, page_end)
+        if window is not doc:
+            numeric_span = (window.Start, window.End)
+
+    # A whole-document run stores a fingerprint of the state it left, so
+    # re-running on an unchanged document returns straight away. It covers
+    # every list paragraph and level in use (see list_fingerprint), and as
+    # a full list pass is only computed when a value was stored.
+    fingerprint_property = _fingerprint_property(modes) if numeric_span is None else None
+    stored = get_doc_property(doc, fingerprint_property) if fingerprint_property else None
+    if stored is not None and stored == list_fingerprint(doc):
+        return {"ok": True, "count_updated": 0, "unchanged": True, "cached": True}
+
+    changed = 0
+    errors = []
+
+    with FastWord(doc):
+        # ListLevel properties belong to the template, so each (template,
+        # level) pair is set and reapplied once however many paragraphs use it.
+        # Its first ListFormat, level number and whether numeric applies to it
+        # (any of its paragraphs inside the window) are collected first.
+        levels = ListLevelCache()
+        found: dict[tuple[int, int], list[Any]] = {}
+        indent_candidates = []
+
+        # Snapshot the paragraphs first so template reapplies cannot shift
+        # the live collection under the iteration
+        paras = list(iter_paragraphs(doc))
+        for para in paras:
+            try:
+                rng = para.Range
+                lf = rng.ListFormat
+                if lf.ListType == C.wdListNoNumbering:
+                    continue
+                level_num = lf.ListLevelNumber
+                in_band = 1 <= level_num <= 3
+                if not in_band and "no_space" not in modes:
+                    continue
+
+                key = levels.key(lf.ListTemplate, level_num)
+                entry = found.get(key)
+                if entry is None:
+                    entry = found[key] = [lf, level_num, False]
+                if "numeric" in modes and in_band and not entry[2]:
+                    entry[2] = numeric_span is None or numeric_span[0] <= rng.Start < numeric_span[1]
+                if "left_indents" in modes and in_band:
+                    indent_candidates.append((para, key, level_num))
+            except Exception as e:
+                errors.append(f"Error processing list paragraph: {str(e)}")
+
+        for key, (lf, level_num, numeric_here) in found.items():
+            try:
+                lvl = levels.level(key)
+                target = _level_target(lvl, level_num, modes if numeric_here else modes - {"numeric"})
+                if not any(_differs(getattr(lvl, name), value) for name, value in target.items()):
+                    continue
+                for name, value in target.items():
+                    setattr(lvl, name, value)
+                # Reapply list template once for all transformations
+                lf.ApplyListTemplateWithLevel(
+                    ListTemplate=lf.ListTemplate,
+                    ContinuePreviousList=True,
+                    ApplyTo=C.wdListApplyToWholeList,
+                    ApplyLevel=level_num
+                )
+                changed += 1
+            except Exception as e:
+                errors.append(f"Error processing list level {level_num}: {str(e)}")
+
+        # Paragraph indents follow left_indents only where numeric did not
+        # apply: there the reapply has moved paragraphs to the numeric
+        # TextPosition. Checked after the reapplies, which reset indents.
+        for para, key, level_num in indent_candidates:
+            if found[key][2]:
+                continue
+            try:
+                fmt = para.Format
+                para_indent = TARGET_INDENT[level_num]
+                if to_twips(fmt.LeftIndent) != to_twips(para_indent):
+                    fmt.LeftIndent = para_indent
+                    fmt.FirstLineIndent = 0
+                    changed += 1
+            except Exception as e:
+                errors.append(f"Error processing list paragraph: {str(e)}")
+
+        # Remember the normalised state so a re-run can return straight away
+        if fingerprint_property and not errors:
+            try:
+                set_doc_property(doc, fingerprint_property, list_fingerprint(doc))
+            except Exception as e:
+                errors.append(f"Could not store list fingerprint: {str(e)}")
+
+        result = {
+            "ok": True,
+            "count_updated": changed,
+            "description": f"Applied {'+'.join(m for m in MODES if m in modes)} ({changed} list level/paragraph update(s))"
+        }
+
+        # Every write is counted, so nothing counted means nothing changed
+        if not changed and not errors:
+            result["unchanged"] = True
+
+        if errors:
+            result["warnings"] = errors[:10]
+            if len(errors) > 10:
+                result["warnings"].append(f"... and {len(errors) - 10} more errors")
+
+        return result
@@ -1,6 +1,87 @@
 from __future__ import annotations
+import logging
+import re
 from typing import Any
-from win32com.client import constants as C
+from .engines import C
+from ._utils import FastWord, page_count
+
+logger = logging.getLogger(__name__)
+
+# "digits." at the very start of the document, where there is no preceding
+# paragraph mark for the wildcard Find to anchor on
+_DOC_START_NUMBER_RE = re.compile(r"[ \t]*[0-9]+\.")
+# "digits." after a paragraph mark and any indenting spaces/tabs (as the
+# VBA original allows); group 1 is the dot plus any spaces/tabs after it,
+# i.e. what becomes the em dash
+_PARA_NUMBER_DOT_RE = re.compile(r"(?<=\r)[ \t]*[0-9]+(\.[ \t]*)")
+# Wildcard equivalents for the Find fallback. Word wildcards have no
+# zero-occurrence repeat, so the indented form is a second pattern.
+_PARA_NUMBER_DOT_WILDCARDS = ("^13[0-9]{1,}.", "^13[ ^t]{1,}[0-9]{1,}.")
+# Whitespace after an em dash already in the text
+_EMDASH_SPACE_RE = re.compile(r"—[ \t]")
+
+
+def _leading_number_dots(doc: Any, rng: Any) -> tuple[list[tuple[int, int]], str, bool]:
+    """
+    Spans to turn into an em dash after each paragraph-leading "digits."
+    (optionally indented with spaces/tabs) within rng, the text that was scanned (for further cheap checks by the
+    caller), and whether the spans already take in the whitespace after
+    the dot.
+
+    The range is widened one character back so the paragraph mark before
+    its first paragraph is included, and scanned as text in Python; there
+    each span is the dot plus trailing spaces/tabs, so the em dash and the
+    space removal are one write. A wildcard Find is the fallback when the
+    text does not map one-to-one onto document positions, giving the dot
+    alone. The paragraph mark (which carries formatting) is never edited.
+    """
+    start, limit = rng.Start, rng.End
+    base = max(start - 1, 0)
+    text = doc.Range(base, limit).Text
+    if len(text) == limit - base:
+        if start == 0:
+            text = "\r" + text
+            base = -1
+        spans = [(base + m.start(1), base + m.end(1)) for m in _PARA_NUMBER_DOT_RE.finditer(text)]
+        return spans, text, True
+
+    dots = []
+    if start == 0:
+        m = _DOC_START_NUMBER_RE.match(doc.Range(0, min(32, limit)).Text)
+        if m:
+            dots.append(m.end() - 1)
+
+    for pattern in _PARA_NUMBER_DOT_WILDCARDS:
+        search = doc.Range(base, limit)
+        f = search.Find
+        f.ClearFormatting()
+        while f.Execute(
+            FindText=pattern,
+            MatchWildcards=True,
+            Forward=True,
+            Wrap=C.wdFindStop,
+            Format=False,
+        ) and search.End <= limit:
+            dots.append(search.End - 1)
+            search.Collapse(C.wdCollapseEnd)
+    return [(pos, pos + 1) for pos in sorted(dots)], text, False
+
+
+def _strip_space_after_emdash(rng: Any) -> None:
+    """Remove spaces/tabs straight after every em dash in rng (one ReplaceAll)."""
+    # All options go in the single Execute call rather than as separate
+    # Find property sets, each of which is its own COM round trip
+    rng.Duplicate.Find.Execute(
+        FindText="—[ ^t]{1,}",
+        MatchCase=False,
+        MatchWildcards=True,
+        Forward=True,
+        Wrap=C.wdFindStop,
+        Format=False,
+        ReplaceWith="—",
+        Replace=C.wdReplaceAll,
+    )
+
 
 def lists_dot_to_emdash_py(doc: Any, page_start: int = 1, page_end: int = 4) -> dict:
     """
@@ -17,12 +98,21 @@ def lists_dot_to_emdash_py(doc: Any, page_start: int = 1, page_end: int = 4) ->
     """
     try:
         app = doc.Application
-        app.ScreenUpdating = False
         changed = 0
         errors = []
         
         # ENFORCE: Only pages 1-4 (matching VBA behavior)
-        total_pages = doc.ComputeStatistics(C.wdStatisticPages)
+        total_pages = page_count(doc)
+        # Document too short to reach the requested pages: nothing to do
+        if page_start > total_pages:
+            return {
+                "ok": True,
+                "count_updated": 0,
+                "unchanged": True,
+                "page_range": f"{page_start}-{page_end}",
+                "description": f"Document has no pages in range {page_start}-{page_end} ({total_pages} page(s))"
+            }
+
         original_page_end = page_end
         page_end = min(page_end, 4, total_pages)
         
@@ -41,75 +131,57 @@ def lists_dot_to_emdash_py(doc: Any, page_start: int = 1, page_end: int = 4) ->
         initial_start = app.Selection.Start
         initial_end = app.Selection.End
 
-        # Loop through specified pages
-        for pg in range(page_start, page_end + 1):
-            try:
-                # --- Step 1: Get range for this page ---
-                rPage = doc.GoTo(What=C.wdGoToPage, Which=C.wdGoToAbsolute, Count=pg)
-                rPage.Start = rPage.Start
-
-                try:
-                    rNext = rPage.GoTo(What=C.wdGoToPage, Which=C.wdGoToNext)
-                    rPage.End = rNext.Start - 1
-                except Exception:
-                    rPage.End = doc.Content.End
-
-                # --- Step 2: Convert numbering to literal text on this page only ---
+        # --- Step 1: Resolve every page span once, before any edits ---
+        content_end = doc.Content.End
+        page_starts = [
+            doc.GoTo(What=C.wdGoToPage, Which=C.wdGoToAbsolute, Count=pg).Start
+            for pg in range(page_start, page_end + 1)
+        ]
+        if page_end < total_pages:
+            next_start = doc.GoTo(What=C.wdGoToPage, Which=C.wdGoToAbsolute, Count=page_end + 1).Start
+            page_starts.append(next_start)
+        else:
+            page_starts.append(content_end + 1)  # last page runs to the end
+
+        # Loop through specified pages with Word's reactive work suspended.
+        # Pages go back to front so edits never shift a span still to come.
+        with FastWord(doc):
+            for i in reversed(range(page_end - page_start + 1)):
+                pg = page_start + i
                 try:
-                    rPage.ListFormat.ConvertNumbersToText()
-                    errors.append(f"INFO: Called ConvertNumbersToText on page {pg}")
-                except Exception as e:
-                    errors.append(f"Warning: ConvertNumbersToText failed on page {pg}: {str(e)}")
-
-                # --- Step 3: Process each paragraph on this page ---
-                for para in rPage.Paragraphs:
-                    try:
-                        pre_text = para.Range.Text[:60].replace('\r', ' ').replace('\n', ' ')
-                        errors.append(f"DEBUG: Pg{pg} Para start: '{pre_text}'")
-
-                        # PYTHON COM FIX: Cannot use .Duplicate like VBA
-                        # Must work directly on para.Range for changes to persist
-                        
-                        # --- 3a) Replace "digits." with "digits—" ---
-                        find = para.Range.Find
-                        find.ClearFormatting()
-                        find.Replacement.ClearFormatting()
-                        find.Text = "([0-9]{1,})."
-                        find.Replacement.Text = r"\1—"
-                        find.MatchWildcards = True
-                        find.Forward = True
-                        find.Wrap = C.wdFindStop  # Stay within paragraph
-                        find.Format = False
+                    rPage = doc.Range(page_starts[i], page_starts[i + 1] - 1)
 
+                    # --- Step 2: Convert numbering to literal text on this page only ---
+                    # (pages without list paragraphs have no numbering to convert)
+                    if rPage.ListParagraphs.Count:
                         try:
-                            if find.Execute(Replace=C.wdReplaceOne):
-                                changed += 1
-                                post_text = para.Range.Text[:60].replace('\r', ' ').replace('\n', ' ')
-                                errors.append(f"SUCCESS: Pg{pg} replaced: '{post_text}'")
+                            rPage.ListFormat.ConvertNumbersToText()
+                            logger.debug("Called ConvertNumbersToText on page %d", pg)
                         except Exception as e:
-                            errors.append(f"DEBUG: find failed on pg{pg}: {str(e)}")
-
-                        # --- 3b) Remove space/tab immediately after em dash ---
-                        find = para.Range.Find
-                        find.ClearFormatting()
-                        find.Replacement.ClearFormatting()
-                        find.Text = "—([ ^t]{1,})"
-                        find.Replacement.Text = "—"
-                        find.MatchWildcards = True
-                        find.Forward = True
-                        find.Wrap = C.wdFindStop
-                        find.Format = False
-                        
+                            errors.append(f"Warning: ConvertNumbersToText failed on page {pg}: {str(e)}")
+
+                    # --- Step 3: Replace "digits." with "digits—" at paragraph starts ---
+                    dots, page_text, trimmed = _leading_number_dots(doc, rPage)
+                    # Back to front so earlier offsets stay valid
+                    for pos, end in reversed(dots):
                         try:
-                            find.Execute(Replace=C.wdReplaceOne)
-                        except Exception:
-                            pass
+                            doc.Range(pos, end).Text = "—"
+                            changed += 1
+                        except Exception as e:
+                            errors.append(f"Error processing paragraph on page {pg}: {str(e)}")
+                    logger.debug("Pg%d converted %d list number(s)", pg, len(dots))
 
-                    except Exception as e:
-                        errors.append(f"Error processing paragraph on page {pg}: {str(e)}")
+                    # --- Step 4: Remove space/tab immediately after em dash ---
+                    # Dashes written from the text scan already dropped their
+                    # spaces, so this is only for ones already in the text
+                    if (dots and not trimmed) or _EMDASH_SPACE_RE.search(page_text):
+                        try:
+                            _strip_space_after_emdash(rPage)
+                        except Exception as e:
+                            logger.debug("Space cleanup failed on pg%d: %s", pg, e)
 
-            except Exception as e:
-                errors.append(f"Error processing page {pg}: {str(e)}")
+                except Exception as e:
+                    errors.append(f"Error processing page {pg}: {str(e)}")
 
         # Restore original selection
         app.Selection.SetRange(initial_start, initial_end)
@@ -131,7 +203,3 @@ def lists_dot_to_emdash_py(doc: Any, page_start: int = 1, page_end: int = 4) ->
             "ok": False,
             "error": str(e)
         }
-
-    finally:
-        if app:
-            app.ScreenUpdating = True
\ No newline at end of file
@@ -1,6 +1,9 @@
 from __future__ import annotations
 from typing import Any
-from win32com.client import constants as C
+from .engines import C
+from ._utils import (
+    NO_LIST_PARAGRAPHS, FastWord, ListLevelCache, has_list_paragraphs, iter_paragraphs, position_of,
+)
 
 def no_space_after_number_all_lists_fix_py(doc: Any) -> dict:
     """
@@ -9,39 +12,63 @@ def no_space_after_number_all_lists_fix_py(doc: Any) -> dict:
     aligning TextPosition with NumberPosition, and removing tab stops.
     
     CRITICAL: Must reapply list template for changes to take effect!
+
+    Kept for single-rule runs; the default rules.yaml runs this together
+    with the other list fixes through fused_list_formatting.
     """
-    app = doc.Application
-    app.ScreenUpdating = False
+    if not has_list_paragraphs(doc):
+        return dict(NO_LIST_PARAGRAPHS)
+
     changed = 0
     errors = []
 
-    try:
-        for para in doc.Paragraphs:
+    # Constants bound to locals for the paragraph loop
+    no_numbering = C.wdListNoNumbering
+    trailing_none = C.wdTrailingNone
+    undefined = C.wdUndefined
+
+    with FastWord(doc):
+        levels = ListLevelCache()
+
+        # Snapshot the paragraphs first so template reapplies inside the
+        # loop cannot shift the live collection under the iteration
+        paras = list(iter_paragraphs(doc))
+        for para in paras:
             try:
                 # Get list format for the paragraph
-                lf = para.Range.ListFormat
-                if lf.ListType != C.wdListNoNumbering:  # Skip if not a list
+                rng = para.Range
+                lf = rng.ListFormat
+                if lf.ListType != no_numbering:  # Skip if not a list
                     try:
                         # Get the list level details
                         lvl_number = lf.ListLevelNumber
                         list_template = lf.ListTemplate
-                        lvl = list_template.ListLevels(lvl_number)
+                        key = levels.key(list_template, lvl_number)
+                        # The fix and the wdListApplyToWholeList reapply act on
+                        # the template level, so each one is handled only once
+                        if not levels.mark_applied(key):
+                            continue
+                        lvl = levels.level(key)
 
-                        # Store original values to detect if changes needed
+                        # Read each level property once (every get is a COM call)
+                        trailing, text_pos, number_pos, tab_pos = (
+                            lvl.TrailingCharacter, lvl.TextPosition,
+                            lvl.NumberPosition, lvl.TabPosition,
+                        )
                         needs_update = (
-                            lvl.TrailingCharacter != C.wdTrailingNone or
-                            lvl.TextPosition != lvl.NumberPosition or
-                            lvl.TabPosition != C.wdUndefined
+                            trailing != trailing_none or
+                            text_pos != number_pos or
+                            tab_pos != undefined
                         )
-                        
+
                         if needs_update:
                             # Apply formatting changes
-                            lvl.TrailingCharacter = C.wdTrailingNone
-                            lvl.TextPosition = lvl.NumberPosition
-                            lvl.TabPosition = C.wdUndefined
+                            lvl.TrailingCharacter = trailing_none
+                            lvl.TextPosition = number_pos
+                            lvl.TabPosition = undefined
 
                             # CRITICAL: Reapply list template to make changes stick
-                            para.Range.ListFormat.ApplyListTemplateWithLevel(
+                            lf.ApplyListTemplateWithLevel(
                                 ListTemplate=list_template,
                                 ContinuePreviousList=True,
                                 ApplyTo=C.wdListApplyToWholeList,
@@ -50,7 +77,7 @@ def no_space_after_number_all_lists_fix_py(doc: Any) -> dict:
                             changed += 1
 
                     except Exception as e:
-                        errors.append(f"Error processing list level at position {para.Range.Start}: {str(e)}")
+                        errors.append(f"Error processing list level at position {position_of(rng)}: {str(e)}")
             except Exception as e:
                 # Skip non-list paragraphs silently
                 pass
@@ -61,6 +88,10 @@ def no_space_after_number_all_lists_fix_py(doc: Any) -> dict:
             "count_updated": changed,
             "description": f"Updated {changed} list paragraphs (removed space after number)"
         }
+
+        # Every write is counted, so nothing counted means nothing changed
+        if not changed and not errors:
+            result["unchanged"] = True
         
         # Add warnings if any errors occurred (but only first 10 to avoid spam)
         if errors:
@@ -69,7 +100,3 @@ def no_space_after_number_all_lists_fix_py(doc: Any) -> dict:
                 result["warnings"].append(f"... and {len(errors) - 10} more errors")
             
         return result
-
-    finally:
-        # Always restore screen updating
-        app.ScreenUpdating = True
\ No newline at end of file
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import Any
-from win32com.client import constants as C
+from .engines import C
+from ._utils import FastWord
 
 def remove_all_tabs_py(doc: Any) -> dict:
     """
@@ -8,11 +9,11 @@ def remove_all_tabs_py(doc: Any) -> dict:
     This helps standardize spacing and prevent formatting inconsistencies.
     """
     app = doc.Application
-    app.ScreenUpdating = False
     changed = 0
     errors = []
 
-    try:
+    # Redraw, repagination and proofing off while Word rewrites the text
+    with FastWord(doc, normal_view=True):
         # Create a Range for the whole document
         rng = doc.Content
         find = rng.Find
@@ -22,28 +23,33 @@ def remove_all_tabs_py(doc: Any) -> dict:
         initial_end = app.Selection.End
 
         try:
+            # One read of the document text says whether there is anything
+            # to replace, and how much
+            tabs = (rng.Text or "").count("\t")
+            if not tabs:
+                return {
+                    "ok": True,
+                    "count_updated": 0,
+                    "unchanged": True,
+                    "description": "No tab characters found in the document"
+                }
+
             # Clear any existing find/replace formatting
             find.ClearFormatting()
             find.Replacement.ClearFormatting()
 
-            # Configure find/replace parameters
-            find.Text = "^t"               # tab character
-            find.Replacement.Text = ""     # replace with nothing
-            find.Forward = True
-            find.Wrap = C.wdFindContinue
-            find.Format = False
-            find.MatchCase = False
-            find.MatchWholeWord = False
-            find.MatchWildcards = False
-
-            # Execute find/replace
+            # Execute find/replace with every option passed positionally in
+            # the one call: FindText, MatchCase, MatchWholeWord,
+            # MatchWildcards, MatchSoundsLike, MatchAllWordForms, Forward,
+            # Wrap, Format, ReplaceWith, Replace
             replaced = find.Execute(
-                Replace=C.wdReplaceAll
+                "^t", False, False, False, False, False,  # tab character
+                True, C.wdFindContinue, False,
+                "", C.wdReplaceAll,                        # replace with nothing
             )
 
             if replaced:
-                # Count occurrences by checking document length change
-                changed = 1  # We can't get exact count, but operation succeeded
+                changed = tabs
             
         except Exception as e:
             errors.append(f"Error during find/replace operation: {str(e)}")
@@ -61,6 +67,3 @@ def remove_all_tabs_py(doc: Any) -> dict:
             result["warnings"] = errors
 
         return result
-
-    finally:
-        app.ScreenUpdating = True
@@ -2,7 +2,12 @@
 Word automation recipe to remove spaces around em dashes.
 """
 
-from win32com.client import constants as C
+import re
+from .engines import C
+from ._utils import FastWord
+
+# An em dash with spaces on either side (what the two passes remove)
+_SPACED_EM_DASH_RE = re.compile(r" +— *|— +")
 
 
 def remove_spaces_around_em_dash_py(doc, page_start=1, page_end=999, **_):
@@ -25,42 +30,47 @@ def remove_spaces_around_em_dash_py(doc, page_start=1, page_end=999, **_):
         initial_start = app.Selection.Start
         initial_end = app.Selection.End
         
-        app.ScreenUpdating = False
         errors = []
         changed = 0
 
         # Get document content
         rng = doc.Content
-        rng.Find.ClearFormatting()
-        rng.Find.Replacement.ClearFormatting()
-
-        # --- 1️⃣ Remove spaces around em dash (both sides) ---
-        find = rng.Find
-        find.Text = "([  ]{1,})—([  ]{1,})"  # Any spaces around em dash
-        find.Replacement.Text = "—"
-        find.MatchWildcards = True
-        find.Forward = True
-        find.Wrap = C.wdFindContinue
-        find.Format = False
-
-        if find.Execute(Replace=C.wdReplaceAll):
-            changed += 1
-
-        # --- 2️⃣ Remove spaces before only (e.g. " —word" → "—word") ---
-        find.Text = "([  ]{1,})—"
-        find.Replacement.Text = "—"
-        find.MatchWildcards = True
-
-        if find.Execute(Replace=C.wdReplaceAll):
-            changed += 1
-
-        # --- 3️⃣ Remove spaces after only (e.g. "word— " → "word—") ---
-        find.Text = "—([  ]{1,})"
-        find.Replacement.Text = "—"
-        find.MatchWildcards = True
 
-        if find.Execute(Replace=C.wdReplaceAll):
-            changed += 1
+        # One read of the text finds the spaced em dashes up front
+        text = rng.Text or ""
+        changed = len(_SPACED_EM_DASH_RE.findall(text))
+        if not changed:
+            return {
+                "ok": True,
+                "count_updated": 0,
+                "unchanged": True,
+                "description": "No spaces around em dashes found"
+            }
+
+        # Redraw, repagination and proofing off while Word rewrites the text
+        with FastWord(doc, normal_view=True):
+            find = rng.Find
+            find.ClearFormatting()
+            find.Replacement.ClearFormatting()
+
+            # Options passed positionally in one call: FindText, MatchCase,
+            # MatchWholeWord, MatchWildcards, MatchSoundsLike,
+            # MatchAllWordForms, Forward, Wrap, Format, ReplaceWith, Replace
+            execute = find.Execute
+            wrap, replace_all = C.wdFindContinue, C.wdReplaceAll
+
+            # The before and after passes between them also cover spaces on
+            # both sides, so no separate pass is needed for that case
+
+            # --- 1️⃣ Remove spaces before (e.g. " —word" → "—word") ---
+            if " —" in text:
+                execute("([  ]{1,})—", False, False, True, False, False,
+                        True, wrap, False, "—", replace_all)
+
+            # --- 2️⃣ Remove spaces after (e.g. "word— " → "word—") ---
+            if "— " in text:
+                execute("—([  ]{1,})", False, False, True, False, False,
+                        True, wrap, False, "—", replace_all)
 
         # Restore original selection
         app.Selection.SetRange(initial_start, initial_end)
@@ -82,5 +92,3 @@ def remove_spaces_around_em_dash_py(doc, page_start=1, page_end=999, **_):
             "error": str(e)
         }
 
-    finally:
-        app.ScreenUpdating = True
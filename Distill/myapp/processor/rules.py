@@ -8,9 +8,12 @@ This module keeps the structure simple to match ops.py:
 
 from __future__ import annotations
 
+import copy
 import json
 import logging
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal
 
@@ -18,23 +21,27 @@ import yaml
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Safety:
     require_same_paragraph_count: bool = True
     require_same_bookmark_count: bool = True
     require_same_inline_shape_count: bool = True
     allow_text_changes: bool = False
+    compare_pre_post: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Step:
     name: str
     select: dict[str, Any]
     actions: list[dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Rules:
     engine: Literal["auto", "word", "libre"] = "auto"
     safety: Safety = field(default_factory=Safety)
@@ -56,6 +63,7 @@ class Rules:
             require_same_bookmark_count=bool(safety_raw.get("require_same_bookmark_count", True)),
             require_same_inline_shape_count=bool(safety_raw.get("require_same_inline_shape_count", True)),
             allow_text_changes=bool(safety_raw.get("allow_text_changes", False)),
+            compare_pre_post=bool(safety_raw.get("compare_pre_post", True)),
         )
 
         steps_raw = raw.get("steps")
@@ -66,8 +74,10 @@ class Rules:
         for i, s in enumerate(steps_raw, start=1):
             if not isinstance(s, dict):
                 raise ValueError(f"Step #{i} must be an object.")
+            name = s.get("name", f"Step #{i}")
             step = Step(
-                name=s.get("name", f"Step #{i}"),
+                # Step names are used as result keys and in logs
+                name=sys.intern(name) if isinstance(name, str) else name,
                 select=s.get("select") or {},
                 actions=s.get("actions") or [],
             )
@@ -102,12 +112,22 @@ def _validate_step(step: Step) -> None:
 def load_rules(path: str | Path) -> Rules:
     """Load YAML/JSON rules and return a validated Rules object (dict-friendly)."""
     p = Path(path)
-    if not p.exists():
+    try:
+        st = p.stat()
+    except OSError:
         raise ValueError(f"Rules file not found: {p}")
 
+    # Parsed once per file version; callers get their own copy to mutate
+    return copy.deepcopy(_load_rules_cached(str(p), st.st_mtime_ns, st.st_size))
+
+
+@lru_cache(maxsize=32)
+def _load_rules_cached(path: str, mtime_ns: int, size: int) -> Rules:
+    """Parse a rules file; mtime_ns and size only key the cache."""
+    p = Path(path)
     try:
         if p.suffix.lower() in {".yml", ".yaml"}:
-            raw = yaml.safe_load(p.read_text(encoding="utf-8"))
+            raw = yaml.load(p.read_bytes(), Loader=_YamlLoader)
         elif p.suffix.lower() == ".json":
             raw = json.loads(p.read_text(encoding="utf-8"))
         else:
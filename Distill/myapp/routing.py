@@ -1,6 +1,6 @@
-from django.urls import re_path
+from django.urls import path
 from . import consumers
 
 websocket_urlpatterns = [
-    re_path(r'ws/process/(?P<document_id>\d+)/$', consumers.DocumentProcessingConsumer.as_asgi()),
-]
\ No newline at end of file
+    path('ws/process/<int:document_id>/', consumers.DocumentProcessingConsumer.as_asgi()),
+]
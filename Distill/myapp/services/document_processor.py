@@ -1,20 +1,85 @@
 """
 Document processing service for handling Word document formatting.
 """
+from functools import lru_cache
 from pathlib import Path
+import copy
+import json
 import logging
 import os
+import threading
 from django.conf import settings
-import win32com.client
-import pythoncom
-import yaml
 from ..models import Document
 from ..processor import engines
-from ..processor.rules import Rules
+from ..processor.rules import Rules, load_rules
 from ..processor import ops
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_RULES_PATH = Path(__file__).parent.parent / 'processor' / 'config' / 'rules.yaml'
+
+
+@lru_cache(maxsize=16)
+def _rules_from_json(payload: str) -> Rules:
+    """Build Rules from a canonical JSON dump of a custom rules dict (cached)."""
+    return Rules.from_dict(json.loads(payload))
+
+
+def _custom_rules(custom_rules: dict) -> Rules:
+    """Rules for a custom rules dict, parsed once per distinct configuration."""
+    try:
+        payload = json.dumps(custom_rules, sort_keys=True)
+    except (TypeError, ValueError):
+        return Rules.from_dict(custom_rules)
+    # Callers get their own copy of the cached object
+    return copy.deepcopy(_rules_from_json(payload))
+
+
+# One Word instance per worker thread, kept between documents. Word is an
+# STA COM server, so its proxies are only valid on the thread that made
+# them; a thread-local slot rather than a shared queue keeps them there.
+_engine_slot = threading.local()
+
+
+def _reuse_word_engine() -> bool:
+    return getattr(settings, 'WORD_ENGINE_REUSE', True)
+
+
+def _acquire_engine():
+    """This thread's pooled WordComEngine if Word still answers, else None."""
+    engine = getattr(_engine_slot, 'engine', None)
+    if engine is None:
+        return None
+    _engine_slot.engine = None
+    try:
+        engine.app.Documents.Count  # Cheap round trip: is Word still alive?
+        return engine
+    except Exception:
+        logger.info("Pooled Word instance is gone; starting a new one")
+        _discard_engine(engine)
+        return None
+
+
+def _release_engine(engine) -> None:
+    """Keep engine for the next document processed on this thread."""
+    if not getattr(_engine_slot, 'com_held', False):
+        # The background task uninitializes COM after each run; holding one
+        # reference of our own keeps the apartment, and so Word, alive
+        import pythoncom
+        pythoncom.CoInitialize()
+        _engine_slot.com_held = True
+    _engine_slot.engine = engine
+
+
+def _discard_engine(engine) -> None:
+    """Quit engine and drop the COM reference held for it, if any."""
+    engine.shutdown()
+    if getattr(_engine_slot, 'com_held', False):
+        _engine_slot.com_held = False
+        import pythoncom
+        pythoncom.CoUninitialize()
+
+
 class DocumentProcessingService:
     def __init__(self):
         self.word_app = None
@@ -32,34 +97,29 @@ class DocumentProcessingService:
             progress_callback: Optional callback function(progress: int, message: str)
                              to report processing progress
         """
+        succeeded = False
         try:
             # COM should already be initialized by the background task
             document.status = 'PROCESSING'
             document.save()
             
             # Load processing rules
+            # (both paths are cached; the rules file per mtime and size)
             if custom_rules:
-                rules = Rules.from_dict(custom_rules)
+                rules = _custom_rules(custom_rules)
             else:
-                rules_path = Path(__file__).parent.parent / 'processor' / 'config' / 'rules.yaml'
-                with open(rules_path, 'r') as f:
-                    rules = Rules.from_dict(yaml.safe_load(f))
-            
-            # Clean up any existing Word instances
-            try:
-                if self.word_app:
-                    self.word_app.Quit()
-            except:
-                pass
+                rules = load_rules(DEFAULT_RULES_PATH)
             
             if progress_callback:
                 progress_callback(5, "Initializing Word...")
 
-            # Initialize engine with proper COM setup
-            self.engine = None
+            # Reuse this thread's Word instance when there is a live one,
+            # otherwise start Word with proper COM setup
+            self.engine = _acquire_engine() if _reuse_word_engine() else None
             for retry in range(3):  # Retry up to 3 times
                 try:
-                    self.engine = engines.WordComEngine()
+                    if self.engine is None:
+                        self.engine = engines.WordComEngine()
                     # Get Word application from engine
                     self.word_app = self.engine.app
                     self.word_app.Visible = False  # Ensure Word stays hidden
@@ -67,9 +127,13 @@ class DocumentProcessingService:
                     break
                 except Exception as e:
                     logger.warning(f"Word initialization attempt {retry + 1} failed: {str(e)}")
+                    if self.engine is not None:
+                        _discard_engine(self.engine)
+                        self.engine = None
                     if retry == 2:  # Last attempt failed
                         raise
                     try:
+                        import pythoncom
                         pythoncom.CoUninitialize()
                         pythoncom.CoInitialize()
                     except:
@@ -105,30 +169,24 @@ class DocumentProcessingService:
                 if progress_callback:
                     progress_callback(30, "Applying formatting rules...")
 
-                # Process document using rules
-                total_steps = len(rules.steps)
-                for idx, step in enumerate(rules.steps, 1):
-                    current_progress = 30 + int((idx / total_steps) * 40)  # Progress from 30% to 70%
-                    progress_message = f"Applying rule: {step.name}"
-                    
+                # Apply every step in one pass; progress is reported per
+                # step in the 30% to 70% band
+                def on_step(idx, total, name, step_result):
                     if progress_callback:
-                        progress_callback(current_progress, progress_message)
-                    
-                    # Apply the step and track progress
-                    result = ops.apply_steps(
-                        self.engine,
-                        doc,
-                        [step],  # Apply one step at a time
-                        rules.safety,
-                        logger
-                    )
-                    
-                    # Report detailed progress through callback if available
-                    if isinstance(result, dict) and 'count_updated' in result:
-                        details = f"Updated {result['count_updated']} items"
-                        if progress_callback:
-                            progress_callback(current_progress, f"{progress_message} - {details}")
-                
+                        progress_callback(
+                            30 + int((idx / total) * 40),
+                            f"Applied rule: {name} - Updated {step_result['modifications']} items",
+                        )
+
+                ops.apply_steps(
+                    self.engine,
+                    doc,
+                    rules.steps,
+                    rules.safety,
+                    logger,
+                    progress_cb=on_step,
+                )
+
                 # Save the processed Word document
                 if progress_callback:
                     progress_callback(75, "Saving processed Word document...")
@@ -148,14 +206,8 @@ class DocumentProcessingService:
                 document.processed_file = f"processed/{docx_name}"
                 document.save()
                 
-                if progress_callback:
-                    progress_callback(80, "Reopening document for PDF conversion...")
-                
-                # Close and reopen to ensure all changes are persisted
-                doc.Close(SaveChanges=False)
-                doc = self.word_app.Documents.Open(str(docx_path))
-                
-                # Export to PDF using ExportAsFixedFormat (proper method for PDF export)
+                # Export to PDF from the document already in memory; it holds
+                # exactly what SaveAs2 just wrote, so no close and reopen
                 if progress_callback:
                     progress_callback(85, "Converting to PDF...")
 
@@ -185,10 +237,13 @@ class DocumentProcessingService:
                 if progress_callback:
                     progress_callback(100, "Processing complete!")
                 
+                succeeded = True
                 return True
                 
             finally:
-                doc.Close(SaveChanges=False)  # No need to save again, already saved above
+                # No need to save again, already saved above; also drops the
+                # page caches keyed on this document
+                self.engine.close_document(doc)
                 
         except Exception as e:
             logger.error(f"Document processing failed: {str(e)}")
@@ -199,27 +254,40 @@ class DocumentProcessingService:
             
         finally:
             # Cleanup in reverse order of creation
-            if self.word_app:
+            if self.engine is not None:
                 try:
-                    for doc in self.word_app.Documents:
+                    for doc in self.engine.app.Documents:
                         try:
                             doc.Close(SaveChanges=False)
                         except:
                             pass
-                    self.word_app.Quit()
                 except:
-                    pass
-                
-                # Force cleanup of any remaining Word processes if needed
-                try:
-                    import win32com.client
-                    win32com.client.Dispatch("WScript.Shell").Run("taskkill /f /im WINWORD.EXE", 0, True)
-                except:
-                    pass
+                    succeeded = False
+
+                # A healthy Word goes back to the pool; one that failed is
+                # quit so the next document starts clean
+                if succeeded and _reuse_word_engine():
+                    _release_engine(self.engine)
+                else:
+                    _discard_engine(self.engine)
+
+                    # Last resort for a hung Word. Off by default: it kills
+                    # every WINWORD.EXE, including other workers' instances
+                    if getattr(settings, 'WORD_FORCE_KILL_ON_FAILURE', False):
+                        try:
+                            import win32com.client
+                            win32com.client.Dispatch("WScript.Shell").Run("taskkill /f /im WINWORD.EXE", 0, True)
+                        except:
+                            pass
+                self.engine = None
+                self.word_app = None
                     
             # COM cleanup is handled by the background task
     def _initialize_word_engine(self):
         """Initialize Word COM engine"""
+        # pywin32 is only needed once a document is actually processed
+        import win32com.client
+
         # Initialize Word
         self.word_app = win32com.client.Dispatch("Word.Application")
         self.word_app.Visible = False
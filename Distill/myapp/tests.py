@@ -1,3 +1,131 @@
-from django.test import TestCase
+import os
+import tempfile
+from pathlib import Path
 
-# Create your tests here.
+from django.test import SimpleTestCase
+
+from .processor.recipes_word.add_space_before_emdash_paragraphs import _EMDASH_RE
+from .processor.recipes_word.engines import C
+from .processor.recipes_word.enforce_structured_list_indents_with_styles import _classify
+from .processor.recipes_word.fused_list_formatting import _parse_mode
+from .processor.recipes_word.lists_dot_to_emdash import _PARA_NUMBER_DOT_RE
+from .processor.rules import _load_rules_cached, load_rules
+
+
+class WordConstantsTests(SimpleTestCase):
+    """The static constants must match Word's enums; recipes write them to documents."""
+
+    def test_trailing_character(self):
+        # WdTrailingCharacter
+        self.assertEqual(C.wdTrailingTab, 0)
+        self.assertEqual(C.wdTrailingSpace, 1)
+        self.assertEqual(C.wdTrailingNone, 2)
+
+    def test_list_constants(self):
+        self.assertEqual(C.wdListNoNumbering, 0)
+        self.assertEqual(C.wdListApplyToWholeList, 0)
+        self.assertEqual(C.wdListLevelAlignLeft, 0)
+        self.assertEqual(C.wdListLevelAlignRight, 2)
+        self.assertEqual(C.wdListNumberStyleArabic, 0)
+        self.assertEqual(C.wdUndefined, 9999999)
+
+    def test_find_and_navigation_constants(self):
+        self.assertEqual(C.wdFindStop, 0)
+        self.assertEqual(C.wdFindContinue, 1)
+        self.assertEqual(C.wdReplaceAll, 2)
+        self.assertEqual(C.wdGoToPage, 1)
+        self.assertEqual(C.wdGoToAbsolute, 1)
+        self.assertEqual(C.wdActiveEndPageNumber, 3)
+        self.assertEqual(C.wdStatisticPages, 2)
+
+    def test_view_and_format_constants(self):
+        self.assertEqual(C.wdAlertsNone, 0)
+        self.assertEqual(C.wdNormalView, 1)
+        self.assertEqual(C.wdAlignParagraphLeft, 0)
+        self.assertEqual(C.wdStyleTypeParagraph, 1)
+        self.assertEqual(C.msoPropertyTypeString, 4)
+
+
+RULES_YAML = """
+steps:
+  - name: {name}
+    select:
+      document: true
+    actions:
+      - word_recipe:
+          name: remove_all_tabs
+"""
+
+
+class LoadRulesCacheTests(SimpleTestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "rules.yaml"
+        _load_rules_cached.cache_clear()
+
+    def write(self, name):
+        self.path.write_text(RULES_YAML.format(name=name), encoding="utf-8")
+
+    def test_unchanged_file_is_parsed_once(self):
+        self.write("First")
+        load_rules(self.path)
+        load_rules(self.path)
+        info = _load_rules_cached.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 1))
+
+    def test_rewritten_file_is_parsed_again(self):
+        self.write("First")
+        self.assertEqual(load_rules(self.path).steps[0].name, "First")
+        self.write("Second step")
+        st = self.path.stat()
+        # Make sure the mtime moves even on coarse-grained filesystems
+        os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        self.assertEqual(load_rules(self.path).steps[0].name, "Second step")
+        self.assertEqual(_load_rules_cached.cache_info().misses, 2)
+
+    def test_callers_get_independent_copies(self):
+        self.write("First")
+        rules = load_rules(self.path)
+        rules.steps.clear()
+        rules = load_rules(self.path)
+        self.assertEqual([s.name for s in rules.steps], ["First"])
+        rules.steps[0].select["document"] = False
+        self.assertIs(load_rules(self.path).steps[0].select["document"], True)
+
+
+class MarkerClassificationTests(SimpleTestCase):
+    def test_structured_list_levels(self):
+        cases = {
+            "1. Text": "L1",
+            "12.Text": "L1",
+            "(1) Text": "L2",
+            "(10) Text": "L2",
+            "(a) Text": "L3",
+            "(B) Text": "L3",
+            "": None,
+            "1 Text": None,
+            "a. Text": None,
+            "(1 Text": None,
+            "(ab) Text": None,
+            "Section 1.": None,
+        }
+        for text, level in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(_classify(text), level)
+
+    def test_emdash_paragraph_starts(self):
+        text = "1—Text\r 2—Indented\rA—Letter\rNo dash\rab—Two"
+        starts = [m.start() for m in _EMDASH_RE.finditer(text)]
+        self.assertEqual(starts, [0, text.index("A—")])
+
+    def test_paragraph_number_dots(self):
+        text = "\r1. One\r \t2.\tTwo\rx 3. Three\r12.Four\r5 Five"
+        found = [(m.group(0), m.group(1)) for m in _PARA_NUMBER_DOT_RE.finditer(text)]
+        self.assertEqual(found, [("1. ", ". "), (" \t2.\t", ".\t"), ("12.", ".")])
+
+    def test_fused_modes(self):
+        self.assertEqual(_parse_mode("numeric + no_space"), {"numeric", "no_space"})
+        self.assertEqual(_parse_mode("left_indents+"), {"left_indents"})
+        with self.assertRaises(ValueError):
+            _parse_mode("left_indents+tabs")